@@ -0,0 +1,104 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+PACK_MAGIC = b"LIESPAK1"
+PACK_VERSION = 1
+# 매직, 헤더(JSON) 길이
+PACK_PREFIX = struct.Struct("<8sI")
+
+
+def content_hash(paths, extra=""):
+    # 원본 파일 내용과 변환 조건(extra)으로 항목 키를 만든다
+    digest = hashlib.sha1(extra.encode("utf-8"))
+    for path in paths:
+        with open(path, "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def read_pack(path):
+    # (헤더, mmap) 반환, 파일이 없거나 형식/버전이 다르면 None
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        return None
+    with handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+    try:
+        magic, header_size = PACK_PREFIX.unpack_from(mapped, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("magic")
+        start = PACK_PREFIX.size
+        header = json.loads(bytes(mapped[start:start + header_size]).decode("utf-8"))
+        if header.get("version") != PACK_VERSION:
+            raise ValueError("version")
+    except (struct.error, ValueError):
+        mapped.close()
+        return None
+    header["data_start"] = start + header_size
+    return header, mapped
+
+
+def write_pack(path, entries):
+    # entries: {이름: (키, [표면, ...])}, RGBA 원시 픽셀을 이어 붙여 임시 파일에 쓴 뒤 교체
+    blobs = []
+    offset = 0
+    header = {"version": PACK_VERSION, "entries": {}}
+    for name, (key, surfaces) in entries.items():
+        frames = []
+        for surface in surfaces:
+            raw = pygame.image.tobytes(surface, "RGBA")
+            frames.append([offset, surface.get_width(), surface.get_height()])
+            blobs.append(raw)
+            offset += len(raw)
+        header["entries"][name] = {"key": key, "frames": frames}
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as handle:
+        handle.write(PACK_PREFIX.pack(PACK_MAGIC, len(header_bytes)))
+        handle.write(header_bytes)
+        for raw in blobs:
+            handle.write(raw)
+    os.replace(temp_path, path)
+
+
+def _read_frames(view, data_start, frames):
+    surfaces = []
+    for offset, width, height in frames:
+        start = data_start + offset
+        raw = view[start:start + width * height * 4]
+        # mmap을 참조하는 표면을 복사해 둔다 (화면 포맷 변환은 하지 않음)
+        surfaces.append(pygame.image.frombuffer(raw, (width, height), "RGBA").copy())
+        raw.release()
+    return surfaces
+
+
+def read_entries(path, keys):
+    # keys: {이름: 현재 키}, 키가 같은 항목의 프레임을 RGBA 표면으로 읽는다
+    # 디스플레이 포맷을 읽지 않으므로 작업 스레드에서 호출해도 된다 (convert_alpha는 호출한 쪽에서 메인 스레드로)
+    # 반환: ({이름: [표면, ...]}, 다시 만들어야 하는 항목 이름 목록, 팩에 keys에 없는 항목이 남아 있는지)
+    packed = read_pack(path)
+    if not packed:
+        return {}, list(keys), False
+    header, mapped = packed
+    entries = header["entries"]
+    result = {}
+    rebuilt = []
+    view = memoryview(mapped)
+    for name, key in keys.items():
+        entry = entries.get(name)
+        if entry and entry["key"] == key:
+            result[name] = _read_frames(view, header["data_start"], entry["frames"])
+        else:
+            rebuilt.append(name)
+    view.release()
+    mapped.close()
+    return result, rebuilt, bool(set(entries) - set(keys))
@@ -1,6 +1,13 @@
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
+from asset_pack import content_hash, read_entries, write_pack
+from atlas import TextureAtlas
+from fonts import load_font
 from setting import (
     PLAYER_RUN_FRAMES,
     PLAYER_RUN_FRAME_SIZE,
@@ -14,6 +21,9 @@ from setting import (
     ENEMY2_FRAMES,
     ENEMY2_FRAME_SIZE,
     ENEMY2_FILE,
+    TITLE_BG_FILE,
+    TITLE_TEXT_FILE,
+    ASSET_LOADER_WORKERS,
 )
 
 ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
@@ -31,6 +41,16 @@ FILE_NAMES = {
     "attack": "attack.png",
 }
 
+# 타이틀 화면용 선택 이미지 (없으면 기본 배경/글자 타이틀)
+TITLE_ASSETS = {
+    "title_bg": TITLE_BG_FILE,
+    "title_text": TITLE_TEXT_FILE,
+}
+
+# 원본 PNG를 잘라/스케일한 결과를 원시 픽셀로 모아 두는 캐시 파일
+ASSET_PACK_FILE = "assets.pack"
+SETTING_PATH = os.path.join(os.path.dirname(__file__), "setting.py")
+
 
 def _safe_print(message):
     try:
@@ -172,17 +192,6 @@ def _placeholder_attack():
     return surf
 
 
-def load_font(size):
-    # 시스템 폰트를 우선 사용하고 실패 시 기본 폰트로 폴백
-    try:
-        return pygame.font.SysFont("malgungothic", size)
-    except Exception:
-        try:
-            return pygame.font.SysFont(None, size)
-        except Exception:
-            return pygame.font.Font(None, size)
-
-
 def save_placeholder(filename, surface):
     path = os.path.join(ASSET_DIR, filename)
     try:
@@ -217,24 +226,39 @@ def ensure_placeholders():
                 _safe_print(f"[assets] placeholder 생성 실패 {filename}: {exc}")
 
 
-def load_image(filename, size=None):
-    # 파일 로드 실패 시 회색 기본 표면 반환
+def decode_image(filename):
+    # PNG 디코딩만 한다 (화면 포맷을 읽지 않아 작업 스레드에서도 호출 가능), 실패하면 None
     path = os.path.join(ASSET_DIR, filename)
     try:
-        image = pygame.image.load(path).convert_alpha()
+        return pygame.image.load(path)
+    except Exception as exc:
+        _safe_print(f"[assets] 로드 실패 {filename}: {exc}")
+        return None
+
+
+def prepare_image(image, filename, size=None):
+    # 메인 스레드에서 화면 포맷으로 변환하고 스케일, 디코딩/변환 실패 시 회색 기본 표면 반환
+    try:
+        if image is None:
+            raise ValueError("디코딩 실패")
+        image = image.convert_alpha()
         if size:
             image = pygame.transform.scale(image, size)
         return image
     except Exception as exc:
-        _safe_print(f"[assets] 로드 실패 {filename}: {exc}")
+        if image is not None:
+            _safe_print(f"[assets] 로드 실패 {filename}: {exc}")
         surface = pygame.Surface(size or (16, 16), pygame.SRCALPHA)
         surface.fill((120, 120, 120))
         return surface
 
 
-def load_sprite_frames(filename, frame_size, frames_count):
+def load_image(filename, size=None):
+    return prepare_image(decode_image(filename), filename, size)
+
+
+def slice_frames(image, frame_size, frames_count):
     # 스프라이트 시트를 프레임 단위로 잘라 리스트로 반환
-    image = load_image(filename)
     width, height = image.get_size()
     if width >= frame_size[0] * frames_count and height >= frame_size[1]:
         frames = []
@@ -246,6 +270,10 @@ def load_sprite_frames(filename, frame_size, frames_count):
     return [pygame.transform.scale(image, frame_size)]
 
 
+def load_sprite_frames(filename, frame_size, frames_count):
+    return slice_frames(load_image(filename), frame_size, frames_count)
+
+
 def load_player_run_frames():
     return load_sprite_frames(PLAYER_RUN_FILE, PLAYER_RUN_FRAME_SIZE, PLAYER_RUN_FRAMES)
 
@@ -262,19 +290,212 @@ def load_enemy2_frames():
     return load_sprite_frames(ENEMY2_FILE, ENEMY2_FRAME_SIZE, ENEMY2_FRAMES)
 
 
-def build_assets():
-    ensure_placeholders()
-    assets = {
-        "player_run_frames": load_player_run_frames(),
-        "player_idle_frames": load_player_idle_frames(),
-        "enemy1_frames": load_enemy1_frames(),
-        "enemy2_frames": load_enemy2_frames(),
-        "tile_floor": load_image(FILE_NAMES["tile_floor"]),
-        "tile_wall": load_image(FILE_NAMES["tile_wall"]),
-        "heart": load_image(FILE_NAMES["heart"]),
-        "goal": load_image(FILE_NAMES["goal"]),
-        "bg": load_image(FILE_NAMES["bg"]),
-        "blood": load_image(FILE_NAMES["blood"], size=(4, 4)),
-        "attack": load_image(FILE_NAMES["attack"], size=(16, 12)),
+class SpriteVariants:
+    def __init__(self, animations):
+        # 애니메이션별 프레임과 좌우 반전 프레임을 미리 만들어 둔다
+        self.frames = {}
+        # attach_atlas 이후: 같은 키 -> [(아틀라스 페이지, 영역), ...]
+        self.regions = {}
+        for name, frames in animations.items():
+            self.add(name, frames)
+
+    def add(self, name, frames):
+        self.frames[(name, 1)] = list(frames)
+        self.frames[(name, -1)] = [pygame.transform.flip(frame, True, False) for frame in frames]
+
+    def count(self, name):
+        return len(self.frames[(name, 1)])
+
+    def frame(self, name, index=0, facing=1):
+        # facing < 0 이면 반전된 프레임, 매 프레임 transform.flip 호출 없음
+        frames = self.frames[(name, -1 if facing < 0 else 1)]
+        return frames[index % len(frames)]
+
+    def attach_atlas(self, atlas):
+        # 아틀라스에 (이름, 방향, 프레임 번호) 키로 들어간 프레임의 영역을 연결
+        self.regions = {
+            key: [atlas.region(key + (index,)) for index in range(len(frames))] for key, frames in self.frames.items()
+        }
+        # 개별 프레임 표면은 버리고 페이지를 공유하는 subsurface로 바꾼다 (frame()은 그대로 동작)
+        self.frames = {
+            key: [atlas.subsurface(key + (index,)) for index in range(len(frames))] for key, frames in self.frames.items()
+        }
+
+    def region(self, name, index=0, facing=1):
+        # frame()과 같은 선택 규칙으로 (아틀라스 페이지, 영역) 반환
+        regions = self.regions[(name, -1 if facing < 0 else 1)]
+        return regions[index % len(regions)]
+
+
+# 스프라이트 변형 이름 -> 에셋 항목 이름
+SPRITE_SOURCES = {
+    "enemy1": "enemy1_frames",
+    "enemy2": "enemy2_frames",
+    "player_run": "player_run_frames",
+    "player_idle": "player_idle_frames",
+    "attack": "attack",
+}
+
+
+def build_sprite_variants(assets):
+    return SpriteVariants(
+        {
+            name: assets[source] if isinstance(assets[source], list) else [assets[source]]
+            for name, source in SPRITE_SOURCES.items()
+        }
+    )
+
+
+# 팩 항목 이름 -> (원본 파일, 프레임 크기, 프레임 수, 스케일 크기), 프레임 크기가 없으면 단일 이미지
+ASSET_ENTRIES = {
+    "player_run_frames": (PLAYER_RUN_FILE, PLAYER_RUN_FRAME_SIZE, PLAYER_RUN_FRAMES, None),
+    "player_idle_frames": (PLAYER_IDLE_FILE, PLAYER_IDLE_FRAME_SIZE, PLAYER_IDLE_FRAMES, None),
+    "enemy1_frames": (ENEMY1_FILE, ENEMY1_FRAME_SIZE, ENEMY1_FRAMES, None),
+    "enemy2_frames": (ENEMY2_FILE, ENEMY2_FRAME_SIZE, ENEMY2_FRAMES, None),
+    "tile_floor": (FILE_NAMES["tile_floor"], None, None, None),
+    "tile_wall": (FILE_NAMES["tile_wall"], None, None, None),
+    "heart": (FILE_NAMES["heart"], None, None, None),
+    "goal": (FILE_NAMES["goal"], None, None, None),
+    "bg": (FILE_NAMES["bg"], None, None, None),
+    "blood": (FILE_NAMES["blood"], None, None, (4, 4)),
+    "attack": (FILE_NAMES["attack"], None, None, (16, 12)),
+}
+
+
+def _finish_entry(name, image):
+    # 디코딩한 원본(image)으로 항목 프레임을 만든다 (메인 스레드)
+    filename, frame_size, frames_count, size = ASSET_ENTRIES[name]
+    if frame_size:
+        return slice_frames(prepare_image(image, filename), frame_size, frames_count)
+    return [prepare_image(image, filename, size)]
+
+
+def _build_entry(name):
+    return _finish_entry(name, decode_image(ASSET_ENTRIES[name][0]))
+
+
+def _entry_keys():
+    # 항목 키 = 원본 PNG 내용 + setting.py 내용 + 변환 조건, 파일이 없으면 OSError
+    with open(SETTING_PATH, "rb") as handle:
+        setting_digest = hashlib.sha1(handle.read()).hexdigest()
+    return {
+        name: content_hash([os.path.join(ASSET_DIR, recipe[0])], setting_digest + repr(recipe))
+        for name, recipe in ASSET_ENTRIES.items()
+    }
+
+
+# 스프라이트 변형 외에 월드에서 개별로 그리는 이미지 (타일/배경은 TileLayer 청크에 미리 구워짐)
+ATLAS_IMAGES = ("heart", "goal", "blood")
+
+
+def build_atlas(assets):
+    # 좌우 반전을 포함한 모든 스프라이트 프레임과 아이콘/이펙트를 아틀라스로 묶는다
+    sprites = assets["sprites"]
+    images = {}
+    for (name, facing), frames in sprites.frames.items():
+        for index, frame in enumerate(frames):
+            images[(name, facing, index)] = frame
+    for name in ATLAS_IMAGES:
+        images[name] = assets[name]
+    atlas = TextureAtlas(images)
+    sprites.attach_atlas(atlas)
+    # 원본 표면 대신 페이지를 공유하는 subsurface를 남겨 같은 이미지를 두 벌 들고 있지 않게 한다
+    for name, source in SPRITE_SOURCES.items():
+        frames = sprites.frames[(name, 1)]
+        assets[source] = frames if isinstance(assets[source], list) else frames[0]
+    for name in ATLAS_IMAGES:
+        assets[name] = atlas.subsurface(name)
+    return atlas
+
+
+def _sources_missing():
+    return any(not os.path.exists(os.path.join(ASSET_DIR, recipe[0])) for recipe in ASSET_ENTRIES.values())
+
+
+def load_title_assets():
+    # 타이틀 이미지는 선택 사항이므로 파일이 없으면 None (placeholder/회색 표면을 만들지 않음)
+    return {
+        name: load_image(filename) if os.path.exists(os.path.join(ASSET_DIR, filename)) else None
+        for name, filename in TITLE_ASSETS.items()
     }
+
+
+def decode_assets(executor=None):
+    # 디스플레이를 건드리지 않는 준비 단계 (백그라운드 스레드에서 호출 가능)
+    # 팩에서 키가 같은 항목을 읽고, 없거나 바뀐 항목은 PNG 디코딩만 한다 (executor가 있으면 스레드 풀에 나눠 맡김)
+    try:
+        keys = _entry_keys()
+    except OSError:
+        # 원본이 빠져 있으면 임시 이미지를 만든 뒤 다시 계산
+        ensure_placeholders()
+        try:
+            keys = _entry_keys()
+        except OSError:
+            keys = None
+    if keys:
+        packed, rebuilt, stale = read_entries(os.path.join(ASSET_DIR, ASSET_PACK_FILE), keys)
+    else:
+        packed, rebuilt, stale = {}, list(ASSET_ENTRIES), False
+    filenames = [ASSET_ENTRIES[name][0] for name in rebuilt]
+    decoded = executor.map(decode_image, filenames) if executor else map(decode_image, filenames)
+    return {"keys": keys, "packed": packed, "decoded": dict(zip(rebuilt, decoded)), "stale": stale}
+
+
+def finish_assets(pending):
+    # 메인 스레드 단계: convert_alpha, 자르기/스케일, 팩 갱신, 스프라이트 변형과 아틀라스
+    # (convert_alpha는 디스플레이 픽셀 포맷을 읽으므로 작업 스레드에서 부르지 않는다)
+    loaded = {name: [frame.convert_alpha() for frame in frames] for name, frames in pending["packed"].items()}
+    for name, image in pending["decoded"].items():
+        loaded[name] = _finish_entry(name, image)
+    loaded = {name: loaded[name] for name in ASSET_ENTRIES}
+    keys = pending["keys"]
+    if keys and (pending["decoded"] or pending["stale"]):
+        try:
+            write_pack(os.path.join(ASSET_DIR, ASSET_PACK_FILE), {name: (keys[name], loaded[name]) for name in keys})
+        except OSError as exc:
+            _safe_print(f"[assets] 에셋 팩 저장 실패: {exc}")
+    assets = {name: frames if ASSET_ENTRIES[name][1] else frames[0] for name, frames in loaded.items()}
+    assets["sprites"] = build_sprite_variants(assets)
+    assets["atlas"] = build_atlas(assets)
     return assets
+
+
+def build_assets(executor=None):
+    # executor: PNG를 다시 디코딩해야 하는 항목을 나눠 맡길 스레드 풀
+    return finish_assets(decode_assets(executor))
+
+
+class AssetLoader:
+    def __init__(self, workers=ASSET_LOADER_WORKERS):
+        # 게임플레이 에셋의 팩 읽기/PNG 디코딩을 백그라운드 스레드에서 하고, 디코딩은 스레드 풀에 나눠 맡긴다
+        # (pygame.image.load는 디코딩 중 GIL을 놓는다, 화면 포맷 변환부터는 result()에서 메인 스레드로)
+        # placeholder는 폰트 렌더링을 하므로 필요할 때만 메인 스레드에서 먼저 만든다
+        if _sources_missing():
+            ensure_placeholders()
+        self.decoders = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-decode")
+        self.runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-load")
+        # 시작 추적용 로딩 구간 (perf_counter)
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self.future = self.runner.submit(self._load)
+
+    def _load(self):
+        try:
+            return decode_assets(self.decoders)
+        finally:
+            self.finished_at = time.perf_counter()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        # 끝날 때까지 기다린 뒤 메인 스레드에서 마무리해 에셋 dict 반환 (로딩 중 예외는 여기서 다시 발생)
+        try:
+            pending = self.future.result()
+        finally:
+            self.close()
+        return finish_assets(pending)
+
+    def close(self):
+        self.runner.shutdown(wait=True)
+        self.decoders.shutdown(wait=True)
@@ -0,0 +1,59 @@
+import pygame
+
+from setting import ATLAS_PAGE_SIZE
+
+# 선형 필터링이 없어도 이웃 프레임과 맞닿지 않도록 1px 간격
+ATLAS_PADDING = 1
+
+
+def shelf_pack(sizes, page_size, padding=ATLAS_PADDING):
+    # 높이 내림차순으로 선반(가로 줄)에 채워 넣고 (페이지, x, y) 목록을 입력 순서대로 반환
+    order = sorted(range(len(sizes)), key=lambda index: (-sizes[index][1], -sizes[index][0]))
+    placements = [None] * len(sizes)
+    page = x = y = shelf_height = 0
+    for index in order:
+        width, height = sizes[index]
+        if width > page_size or height > page_size:
+            raise ValueError(f"아틀라스 페이지({page_size}px)보다 큰 이미지: {width}x{height}")
+        if x + width > page_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > page_size:
+            page += 1
+            x = y = shelf_height = 0
+        placements[index] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+class TextureAtlas:
+    def __init__(self, images, page_size=ATLAS_PAGE_SIZE):
+        # images: {키: 표면}, 키마다 (페이지 표면, 영역 Rect)를 기억해 blit(area=...)로 그린다
+        keys = list(images)
+        sizes = [images[key].get_size() for key in keys]
+        placements = shelf_pack(sizes, page_size)
+        page_heights = {}
+        for (page, _, y), (_, height) in zip(placements, sizes):
+            page_heights[page] = max(page_heights.get(page, 0), y + height)
+        self.pages = [
+            pygame.Surface((page_size, page_heights[page]), pygame.SRCALPHA) for page in sorted(page_heights)
+        ]
+        self.regions = {}
+        for key, (page, x, y) in zip(keys, placements):
+            surface = self.pages[page]
+            # 투명한 페이지에 알파 합성 없이 그대로 복사
+            surface.blit(images[key], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            self.regions[key] = (surface, pygame.Rect((x, y), images[key].get_size()))
+
+    def __len__(self):
+        return len(self.regions)
+
+    def region(self, key):
+        return self.regions[key]
+
+    def subsurface(self, key):
+        # 페이지 픽셀을 공유하는 표면 (복사본 없이 일반 blit/크기 조회용)
+        page, area = self.regions[key]
+        return page.subsurface(area)
@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from headless import KeyState, create_headless_game
+
+import pygame
+
+from assets import build_assets
+from entities import Enemy1, Enemy2, Heart
+from game import Game
+from main import INTERNAL_WIDTH, INTERNAL_HEIGHT
+from platformer_world import TILE_SIZE, LEVEL_PIXEL_H, build_map
+from setting import STARTUP_BUDGET_MS
+
+# 측정 대상별 (한 번의 반복에서 호출할 횟수)
+TARGET_CALLS = {
+    "update": 120,
+    "draw_world": 60,
+    "move_and_collide": 500,
+    "enemy1_update": 120,
+}
+REPEATS = 7
+
+
+def build_wide_map(width):
+    # stage_1 지형을 가로로 이어 붙여 원하는 폭의 맵을 만든다
+    base = build_map()
+    rows = []
+    for row in base:
+        repeated = row * (width // len(row) + 1)
+        rows.append(repeated[:width])
+    return rows
+
+
+def setup_stage_1(game):
+    game.reset_stage()
+
+
+def setup_enemies_200(game):
+    game.reset_stage()
+    ground_y = LEVEL_PIXEL_H - TILE_SIZE * 4
+    for index in range(200):
+        x = TILE_SIZE * (4 + (index * 7) % 80)
+        if index % 2 == 0:
+            game.world.enemies.append(Enemy1(x, ground_y, speed=60))
+        else:
+            game.world.enemies.append(Enemy2(x, ground_y, speed=85, rng=game.rng))
+
+
+def setup_particles_2000(game):
+    game.reset_stage()
+    for index in range(2000):
+        game.particles.emit(TILE_SIZE * (2 + index % 20), LEVEL_PIXEL_H - TILE_SIZE * 6, 1, rng=game.rng)
+
+
+def setup_boss_phase_3(game):
+    game.reset_stage()
+    boss = game.world.boss
+    boss.hp = int(boss.max_hp * 0.25)
+    game.player.rect.midbottom = (boss.rect.centerx - 80, LEVEL_PIXEL_H - TILE_SIZE * 2)
+    game.player.invincible_timer = 1e9
+    game.update_camera()
+
+
+def setup_boss_bullets_500(game):
+    # 보스 주변에 오래 남는 작은 공격 판정 500개를 깔아 둔 탄막 상황
+    setup_boss_phase_3(game)
+    boss = game.world.boss
+    for index in range(500):
+        x = boss.rect.centerx - 300 + (index * 29) % 600
+        y = TILE_SIZE * 2 + (index * 41) % (LEVEL_PIXEL_H - TILE_SIZE * 6)
+        boss.spawn_attack(pygame.Rect(x, y, 8, 8), duration=1e9)
+
+
+def setup_wide_map_2000(game):
+    game.reset_stage(build_wide_map(2000))
+
+
+def make_sprite_setup(count):
+    # 화면 3개 폭에 스프라이트(하트)를 흩어 놓아 일부는 화면 밖에 있게 한다
+    def setup(game):
+        game.reset_stage()
+        view_w = game.render_surface.get_width()
+        for index in range(count):
+            x = (index * 37) % (view_w * 3)
+            y = TILE_SIZE + (index * 53) % (LEVEL_PIXEL_H - TILE_SIZE * 4)
+            game.world.add_heart(Heart(x, y, rng=game.rng))
+        game.player.rect.x = view_w
+        game.update_camera()
+
+    return setup
+
+
+def setup_wide_population_1000(game):
+    # 긴 맵 전체에 적 1000마리를 흩어 놓는다 (화면 근처는 일부뿐)
+    game.reset_stage(build_wide_map(2000))
+    ground_y = LEVEL_PIXEL_H - TILE_SIZE * 4
+    for index in range(1000):
+        x = TILE_SIZE * (4 + index * 2)
+        if index % 2 == 0:
+            game.world.enemies.append(Enemy1(x, ground_y, speed=60))
+        else:
+            game.world.enemies.append(Enemy2(x, ground_y, speed=85, rng=game.rng))
+
+
+SCENARIOS = {
+    "stage_1": setup_stage_1,
+    "enemies_200": setup_enemies_200,
+    "particles_2000": setup_particles_2000,
+    "boss_phase_3": setup_boss_phase_3,
+    "boss_bullets_500": setup_boss_bullets_500,
+    "wide_map_2000": setup_wide_map_2000,
+    "wide_population_1000": setup_wide_population_1000,
+    "sprites_50": make_sprite_setup(50),
+    "sprites_500": make_sprite_setup(500),
+    "sprites_5000": make_sprite_setup(5000),
+}
+
+
+def _target_update(game):
+    game.update(game.fixed_dt)
+
+
+def _target_draw_world(game):
+    game.draw_world()
+
+
+def _target_move_and_collide(game):
+    game.player.move_and_collide(game.fixed_dt, game.world)
+
+
+def _target_enemy1_update(game):
+    for enemy in game.world.enemies:
+        if isinstance(enemy, Enemy1):
+            enemy.update(game.fixed_dt, game.world, game.player)
+
+
+TARGETS = {
+    "update": _target_update,
+    "draw_world": _target_draw_world,
+    "move_and_collide": _target_move_and_collide,
+    "enemy1_update": _target_enemy1_update,
+}
+
+
+def _summarize(samples_us):
+    return {
+        "median_us": round(statistics.median(samples_us), 3),
+        "min_us": round(min(samples_us), 3),
+        "mean_us": round(statistics.fmean(samples_us), 3),
+    }
+
+
+def measure(game, setup, target, calls, repeats=REPEATS, seed=0):
+    # 매 반복마다 시나리오를 새로 구성하고 호출당 평균 시간을 샘플로 쓴다
+    samples = []
+    for repeat in range(repeats):
+        game.reseed(seed + repeat)
+        setup(game)
+        start = time.perf_counter()
+        for _ in range(calls):
+            target(game)
+        samples.append((time.perf_counter() - start) * 1e6 / calls)
+    return _summarize(samples)
+
+
+def measure_build_assets(repeats=REPEATS):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build_assets()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return _summarize(samples)
+
+
+def measure_first_frame(repeats=REPEATS):
+    # time-to-first-frame: 에셋을 스트리밍하는 Game 생성부터 타이틀 첫 화면 출력까지
+    screen = pygame.display.get_surface()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        game = Game(screen, pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)), seed=0, stream_assets=True)
+        game.draw()
+        samples.append((time.perf_counter() - start) * 1e6)
+        game.poll_assets(wait=True)
+    return _summarize(samples)
+
+
+def measure_cold_start(repeats=REPEATS):
+    # 새 프로세스에서 main.py를 띄워 임포트부터 첫 타이틀 프레임까지 (StartupTrace 보고서 기준)
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    samples = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = os.path.join(temp_dir, "startup.json")
+        for _ in range(repeats):
+            # 이전 실행의 보고서를 다시 읽지 않도록 매번 지운다
+            if os.path.exists(report_path):
+                os.remove(report_path)
+            result = subprocess.run(
+                [sys.executable, main_path, "--exit-after-startup", "--startup-report", report_path],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
+            report = None
+            if os.path.exists(report_path):
+                with open(report_path, "r", encoding="utf-8") as handle:
+                    report = json.load(handle)
+            # 종료 코드 1은 예산 초과를 보고한 경우에만 정상 실행으로 본다
+            expected_code = 0 if report is None or report["within_budget"] else 1
+            if report is None or result.returncode != expected_code:
+                raise RuntimeError(
+                    f"main.py 시작 실패 (종료 코드 {result.returncode}): {result.stderr.strip()[-500:]}"
+                )
+            samples.append(report["first_frame_ms"] * 1000.0)
+    return _summarize(samples)
+
+
+def run_benchmarks(scenarios=None, targets=None, repeats=REPEATS, cold_start=False):
+    # cold_start: main.py를 repeats번 새 프로세스로 띄워 콜드 스타트도 측정
+    game = create_headless_game(seed=0)
+    game.state = "playing"
+    game.key_source = lambda: KeyState()
+    results = {}
+    for name in scenarios or SCENARIOS:
+        results[name] = {}
+        for target in targets or TARGETS:
+            results[name][target] = measure(game, SCENARIOS[name], TARGETS[target], TARGET_CALLS[target], repeats)
+    results["startup"] = {
+        "build_assets": measure_build_assets(repeats),
+        "first_frame": measure_first_frame(repeats),
+    }
+    if cold_start:
+        results["startup"]["cold_start"] = measure_cold_start(repeats)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "hz": round(1.0 / game.fixed_dt),
+            "repeats": repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    # 중앙값 기준으로 기준선 대비 비율을 출력하고 회귀 항목을 반환
+    regressions = []
+    for scenario, targets in current["results"].items():
+        for target, stats in targets.items():
+            base = baseline["results"].get(scenario, {}).get(target)
+            if not base or not base["median_us"]:
+                print(f"  {scenario:<16} {target:<18} {stats['median_us']:>10.1f}us  (기준 없음)")
+                continue
+            ratio = stats["median_us"] / base["median_us"]
+            flag = ""
+            if ratio > 1.0 + tolerance:
+                flag = "  << 회귀"
+                regressions.append((scenario, target, ratio))
+            print(
+                f"  {scenario:<16} {target:<18} {base['median_us']:>10.1f}us -> "
+                f"{stats['median_us']:>10.1f}us  x{ratio:.2f}{flag}"
+            )
+    return regressions
+
+
+def print_results(report):
+    for scenario, targets in report["results"].items():
+        for target, stats in targets.items():
+            print(f"  {scenario:<16} {target:<18} {stats['median_us']:>10.1f}us (min {stats['min_us']:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="update/draw 핫패스 벤치마크")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용 회귀 비율 (기본 15%%)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="실행할 시나리오")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS), help="측정할 대상")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument(
+        "--cold-start", action="store_true", help="main.py 콜드 스타트 측정 및 STARTUP_BUDGET_MS 예산 검사"
+    )
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.scenario, args.target, args.repeats, args.cold_start)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+    # 시작 시간은 기준선과 상관없이 고정 예산으로 검사 (--cold-start일 때만)
+    over_budget = False
+    if args.cold_start:
+        cold_ms = report["results"]["startup"]["cold_start"]["median_us"] / 1000.0
+        over_budget = cold_ms > STARTUP_BUDGET_MS
+        if over_budget:
+            print(f"[bench] 시작 시간 {cold_ms:.1f}ms, 예산 {STARTUP_BUDGET_MS}ms 초과")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(report, baseline, args.tolerance)
+        pygame.quit()
+        if regressions:
+            print(f"[bench] 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+            return 1
+        return 1 if over_budget else 0
+    print_results(report)
+    pygame.quit()
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
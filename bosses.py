@@ -0,0 +1,320 @@
+import random
+import pygame
+
+from entities import Entity
+from spatial_hash import SpatialHash
+
+
+class BossAttack:
+    def __init__(self, rect, duration=0.35, damage=1, color=(220, 80, 80)):
+        self.rect = rect
+        self.timer = duration
+        self.damage = damage
+        self.color = color
+        self.active = True
+
+    def update(self, dt):
+        self.timer -= dt
+        if self.timer <= 0:
+            self.active = False
+
+
+class BossTelegraph:
+    def __init__(self, rect, duration=0.4, color=(220, 200, 80)):
+        self.rect = rect
+        self.timer = duration
+        self.active = True
+        self.color = color
+
+    def update(self, dt):
+        self.timer -= dt
+        if self.timer <= 0:
+            self.active = False
+
+
+class BossBase(Entity):
+    def __init__(self, x, y, width, height, hp, rng=random):
+        super().__init__(x, y, width, height)
+        # 패턴 선택용 난수 (세션 시드 RNG를 주입하면 재현 가능)
+        self.rng = rng
+        self.max_hp = hp
+        self.hp = hp
+        self.phase = 1
+        self.state = "idle"
+        self.state_timer = 0
+        self.attack_timer = 0
+        self.attacks = []
+        # 공격 판정 조회용 공간 해시 (생성/소멸 시 갱신)
+        self.attack_hash = SpatialHash()
+        self.telegraphs = []
+        self.color = (160, 160, 180)
+
+    def update(self, dt, world, player):
+        self.state_timer = max(0, self.state_timer - dt)
+        for attack in list(self.attacks):
+            attack.update(dt)
+            if not attack.active:
+                self.attacks.remove(attack)
+                self.attack_hash.remove(attack)
+        for telegraph in list(self.telegraphs):
+            telegraph.update(dt)
+            if not telegraph.active:
+                self.telegraphs.remove(telegraph)
+
+    def spawn_telegraph(self, rect, duration=0.4, color=(220, 200, 80)):
+        self.telegraphs.append(BossTelegraph(rect, duration, color))
+
+    def spawn_attack(self, rect, duration=0.35, damage=1, color=(220, 80, 80)):
+        attack = BossAttack(rect, duration, damage, color)
+        self.attacks.append(attack)
+        self.attack_hash.insert(attack)
+
+    def apply_damage(self, dmg):
+        self.hp = max(0, self.hp - dmg)
+        if self.hp == 0:
+            self.alive = False
+
+
+class DirectorBoss(BossBase):
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, 32, 40, hp=20, rng=rng)
+        self.color = (140, 110, 160)
+
+    def update(self, dt, world, player):
+        super().update(dt, world, player)
+        hp_ratio = self.hp / self.max_hp
+        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
+        self.attack_timer -= dt
+        if self.attack_timer > 0:
+            return
+
+        if self.phase == 1:
+            self._camera_beam(player, world)
+            self.attack_timer = 1.6
+        elif self.phase == 2:
+            if self.rng.random() < 0.5:
+                self._spotlight(world)
+            else:
+                self._camera_beam(player, world)
+            self.attack_timer = 1.3
+        else:
+            roll = self.rng.random()
+            if roll < 0.4:
+                self._camera_beam(player, world)
+            elif roll < 0.8:
+                self._spotlight(world)
+            else:
+                self._cut_command(player)
+            self.attack_timer = 1.1
+
+    def _camera_beam(self, player, world):
+        rect = pygame.Rect(world.camera_x if hasattr(world, "camera_x") else 0, player.rect.centery - 6, world.level_width, 12)
+        self.spawn_telegraph(rect, duration=0.4, color=(220, 120, 120))
+        self.spawn_attack(rect, duration=0.3, damage=2)
+
+    def _spotlight(self, world):
+        x = self.rect.centerx + self.rng.randint(-80, 80)
+        y = self.rect.bottom + 20
+        rect = pygame.Rect(x - 18, y - 18, 36, 36)
+        self.spawn_telegraph(rect, duration=0.5, color=(220, 200, 100))
+        self.spawn_attack(rect, duration=0.35, damage=2, color=(220, 120, 80))
+
+    def _cut_command(self, player):
+        rect = pygame.Rect(player.rect.centerx - 10, player.rect.centery - 10, 20, 20)
+        self.spawn_telegraph(rect, duration=0.3, color=(200, 200, 200))
+        self.spawn_attack(rect, duration=0.2, damage=1, color=(200, 200, 220))
+
+
+class DancerBoss(BossBase):
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, 26, 38, hp=18, rng=rng)
+        self.color = (180, 80, 110)
+
+    def update(self, dt, world, player):
+        super().update(dt, world, player)
+        hp_ratio = self.hp / self.max_hp
+        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
+        self.attack_timer -= dt
+        if self.attack_timer > 0:
+            return
+
+        if self.phase == 1:
+            self._ribbon_slash(player)
+            self.attack_timer = 1.3
+        elif self.phase == 2:
+            if self.rng.random() < 0.5:
+                self._dive_stab(player)
+            else:
+                self._ribbon_slash(player)
+            self.attack_timer = 1.1
+        else:
+            roll = self.rng.random()
+            if roll < 0.4:
+                self._afterimage_fake(player)
+            elif roll < 0.7:
+                self._dive_stab(player)
+            else:
+                self._ribbon_slash(player)
+            self.attack_timer = 0.95
+
+    def _ribbon_slash(self, player):
+        direction = 1 if player.rect.centerx >= self.rect.centerx else -1
+        rect = pygame.Rect(self.rect.centerx + direction * 10, self.rect.centery - 12, 36, 24)
+        self.spawn_telegraph(rect, duration=0.3, color=(220, 150, 180))
+        self.spawn_attack(rect, duration=0.3, damage=2, color=(200, 80, 120))
+
+    def _dive_stab(self, player):
+        rect = pygame.Rect(player.rect.centerx - 12, player.rect.centery - 24, 24, 48)
+        self.spawn_telegraph(rect, duration=0.35, color=(200, 200, 220))
+        self.spawn_attack(rect, duration=0.25, damage=2, color=(160, 120, 220))
+
+    def _afterimage_fake(self, player):
+        rect = pygame.Rect(player.rect.centerx - 18, player.rect.centery - 12, 36, 24)
+        self.spawn_telegraph(rect, duration=0.2, color=(140, 140, 180))
+        self.spawn_attack(rect, duration=0.2, damage=2, color=(200, 80, 100))
+
+
+class JudgeBoss(BossBase):
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, 36, 44, hp=22, rng=rng)
+        self.color = (110, 140, 180)
+
+    def update(self, dt, world, player):
+        super().update(dt, world, player)
+        hp_ratio = self.hp / self.max_hp
+        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
+        self.attack_timer -= dt
+        if self.attack_timer > 0:
+            return
+
+        if self.phase == 1:
+            self._hammer_drop(player)
+            self.attack_timer = 1.5
+        elif self.phase == 2:
+            if self.rng.random() < 0.5:
+                self._scale_verdict(player)
+            else:
+                self._hammer_drop(player)
+            self.attack_timer = 1.3
+        else:
+            roll = self.rng.random()
+            if roll < 0.4:
+                self._scale_verdict(player)
+            elif roll < 0.8:
+                self._judgement_zone(player)
+            else:
+                self._hammer_drop(player)
+            self.attack_timer = 1.1
+
+    def _hammer_drop(self, player):
+        rect = pygame.Rect(player.rect.centerx - 16, player.rect.centery - 20, 32, 40)
+        self.spawn_telegraph(rect, duration=0.6, color=(200, 180, 120))
+        self.spawn_attack(rect, duration=0.3, damage=2, color=(180, 120, 80))
+
+    def _scale_verdict(self, player):
+        left_rect = pygame.Rect(player.rect.centerx - 70, player.rect.centery - 16, 40, 32)
+        right_rect = pygame.Rect(player.rect.centerx + 30, player.rect.centery - 16, 40, 32)
+        danger = left_rect if self.rng.random() < 0.5 else right_rect
+        self.spawn_telegraph(danger, duration=0.45, color=(200, 120, 120))
+        self.spawn_attack(danger, duration=0.35, damage=2, color=(160, 80, 80))
+
+    def _judgement_zone(self, player):
+        rect = pygame.Rect(player.rect.centerx - 50, player.rect.centery - 10, 100, 20)
+        self.spawn_telegraph(rect, duration=0.4, color=(180, 200, 200))
+        self.spawn_attack(rect, duration=0.5, damage=1, color=(140, 180, 180))
+
+
+class ClownBoss(BossBase):
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, 30, 36, hp=19, rng=rng)
+        self.color = (200, 120, 80)
+
+    def update(self, dt, world, player):
+        super().update(dt, world, player)
+        hp_ratio = self.hp / self.max_hp
+        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
+        self.attack_timer -= dt
+        if self.attack_timer > 0:
+            return
+
+        if self.phase == 1:
+            self._flip_charge(player)
+            self.attack_timer = 1.4
+        elif self.phase == 2:
+            if self.rng.random() < 0.5:
+                self._clone_slash(player)
+            else:
+                self._flip_charge(player)
+            self.attack_timer = 1.2
+        else:
+            roll = self.rng.random()
+            if roll < 0.4:
+                self._wire_mandate(player)
+            elif roll < 0.8:
+                self._clone_slash(player)
+            else:
+                self._flip_charge(player)
+            self.attack_timer = 1.0
+
+    def _flip_charge(self, player):
+        rect = pygame.Rect(player.rect.centerx - 30, player.rect.centery - 10, 60, 20)
+        self.spawn_telegraph(rect, duration=0.4, color=(200, 140, 80))
+        self.spawn_attack(rect, duration=0.3, damage=2, color=(200, 90, 60))
+
+    def _clone_slash(self, player):
+        rect = pygame.Rect(player.rect.centerx - 20, player.rect.centery - 20, 40, 40)
+        self.spawn_telegraph(rect, duration=0.35, color=(140, 140, 140))
+        self.spawn_attack(rect, duration=0.3, damage=2, color=(180, 60, 60))
+
+    def _wire_mandate(self, player):
+        rect = pygame.Rect(player.rect.centerx - 80, player.rect.centery - 6, 160, 12)
+        self.spawn_telegraph(rect, duration=0.4, color=(220, 100, 100))
+        self.spawn_attack(rect, duration=0.35, damage=2, color=(200, 60, 80))
+
+
+class ArchivistBoss(BossBase):
+    def __init__(self, x, y, rng=random):
+        super().__init__(x, y, 40, 46, hp=24, rng=rng)
+        self.color = (100, 140, 120)
+
+    def update(self, dt, world, player):
+        super().update(dt, world, player)
+        hp_ratio = self.hp / self.max_hp
+        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
+        self.attack_timer -= dt
+        if self.attack_timer > 0:
+            return
+
+        if self.phase == 1:
+            self._page_storm(player)
+            self.attack_timer = 1.6
+        elif self.phase == 2:
+            if self.rng.random() < 0.5:
+                self._shelf_press(player)
+            else:
+                self._page_storm(player)
+            self.attack_timer = 1.3
+        else:
+            roll = self.rng.random()
+            if roll < 0.4:
+                self._time_stasis(player)
+            elif roll < 0.8:
+                self._shelf_press(player)
+            else:
+                self._page_storm(player)
+            self.attack_timer = 1.1
+
+    def _page_storm(self, player):
+        rect = pygame.Rect(player.rect.centerx - 60, player.rect.centery - 16, 120, 32)
+        self.spawn_telegraph(rect, duration=0.35, color=(160, 200, 160))
+        self.spawn_attack(rect, duration=0.4, damage=2, color=(120, 160, 120))
+
+    def _shelf_press(self, player):
+        rect = pygame.Rect(player.rect.centerx - 90, player.rect.centery - 24, 180, 48)
+        self.spawn_telegraph(rect, duration=0.45, color=(160, 120, 80))
+        self.spawn_attack(rect, duration=0.35, damage=2, color=(120, 90, 60))
+
+    def _time_stasis(self, player):
+        rect = pygame.Rect(player.rect.centerx - 30, player.rect.centery - 30, 60, 60)
+        self.spawn_telegraph(rect, duration=0.4, color=(140, 180, 220))
+        self.spawn_attack(rect, duration=0.3, damage=1, color=(100, 140, 200))
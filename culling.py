@@ -0,0 +1,35 @@
+from bisect import bisect_left
+
+import pygame
+
+
+def camera_rect(camera_x, surface):
+    # 월드 좌표계의 현재 화면 영역
+    return pygame.Rect(camera_x, 0, surface.get_width(), surface.get_height())
+
+
+def clip_to_view(rect, view, outline=False):
+    # 레벨 전체를 가로지르는 빔 같은 사각형을 화면 범위로 잘라낸다
+    # 테두리만 그리는 경우 잘린 가장자리가 화면 밖에 오도록 1픽셀 넓게 자른다
+    if outline:
+        view = view.inflate(2, 2)
+    return rect.clip(view)
+
+
+class IntervalIndex:
+    def __init__(self, items, margin=0):
+        # 항목을 rect.left 기준으로 정렬해 두고, 가로 구간 질의를 이분 탐색으로 처리
+        # (원래 목록 순서를 함께 저장해 그리는 순서는 바뀌지 않게 한다)
+        self.entries = sorted(enumerate(items), key=lambda entry: entry[1].rect.left)
+        self.lefts = [item.rect.left for _, item in self.entries]
+        self.max_width = max((item.rect.width for _, item in self.entries), default=0) + margin
+        self.margin = margin
+        self.size = len(self.entries)
+
+    def query(self, left, right):
+        # [left, right) 구간과 겹칠 수 있는 항목만 반환 (margin은 보간/스프라이트 오프셋 여유)
+        start = bisect_left(self.lefts, left - self.max_width)
+        end = bisect_left(self.lefts, right + self.margin)
+        hits = [entry for entry in self.entries[start:end] if entry[1].rect.right + self.margin > left]
+        hits.sort(key=lambda entry: entry[0])
+        return [item for _, item in hits]
@@ -2,16 +2,55 @@ import math
 import random
 import pygame
 
+from platformer_world import TILE_SIZE, find_patrol_bounds
+
 
 class Entity:
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.vel = pygame.Vector2(0, 0)
         self.alive = True
+        self.remainder = pygame.Vector2(0, 0)
+        self.prev_pos = (x, y)
+        # 활성 구간 밖에서 잠들어 있던 누적 시간 (0이면 깨어 있음)
+        self.sleep_time = 0.0
 
     def update(self, dt, world, player):
         raise NotImplementedError
 
+    def update_activation(self, left, right, dt, fast_forward=True):
+        # 가로 활성 구간 밖이면 잠들고(갱신 생략), 다시 들어오면 깨어나며 True 반환
+        if self.rect.right < left or self.rect.left > right:
+            self.sleep_time += dt
+            return False
+        if self.sleep_time:
+            if fast_forward:
+                self.fast_forward(self.sleep_time)
+            self.sleep_time = 0.0
+        return True
+
+    def fast_forward(self, elapsed):
+        # 잠든 동안 흐른 시간만큼 위치와 무관한 상태(타이머 등)를 진행
+        pass
+
+    def consume_motion(self, axis, amount):
+        # 정수 픽셀로 잘리는 소수점 이동량을 누적해 틱 주기와 무관하게 속도를 유지
+        total = self.remainder[axis] + amount
+        whole = int(total)
+        self.remainder[axis] = total - whole
+        return whole
+
+    def snapshot(self):
+        # 렌더 보간을 위해 틱 시작 시점의 위치를 기록
+        self.prev_pos = (self.rect.x, self.rect.y)
+
+    def render_pos(self, alpha):
+        prev_x, prev_y = self.prev_pos
+        return (
+            prev_x + (self.rect.x - prev_x) * alpha,
+            prev_y + (self.rect.y - prev_y) * alpha,
+        )
+
 
 class AttackHitbox:
     def __init__(self, rect, duration=0.12):
@@ -25,21 +64,6 @@ class AttackHitbox:
             self.active = False
 
 
-class Particle:
-    def __init__(self, x, y):
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(random.uniform(-90, 90), random.uniform(-160, -50))
-        self.timer = random.uniform(0.4, 0.8)
-
-    def update(self, dt):
-        self.timer -= dt
-        self.vel.y += 450 * dt
-        self.pos += self.vel * dt
-
-    def alive(self):
-        return self.timer > 0
-
-
 class Player(Entity):
     def __init__(self, x, y):
         super().__init__(x, y, 18, 24)
@@ -157,12 +181,15 @@ class Player(Entity):
             gravity = self.gravity if self.vel.y < 0 and jump_held else self.fall_gravity
             self.vel.y += gravity * dt
 
-    def move_and_collide(self, dt, solids):
-        self.rect.x += int(self.vel.x * dt)
-        self._collide_axis(solids, axis="x")
-        self.rect.y += int(self.vel.y * dt)
+    def move_and_collide(self, dt, world):
+        # 이동 전후를 합친 영역(swept AABB)의 타일만 검사
+        start = self.rect.copy()
+        self.rect.x += self.consume_motion(0, self.vel.x * dt)
+        self._collide_axis(world.solids_in(start.union(self.rect)), axis="x")
+        start = self.rect.copy()
+        self.rect.y += self.consume_motion(1, self.vel.y * dt)
         self.on_ground = False
-        self._collide_axis(solids, axis="y")
+        self._collide_axis(world.solids_in(start.union(self.rect)), axis="y")
 
     def _collide_axis(self, solids, axis):
         for solid in solids:
@@ -173,6 +200,7 @@ class Player(Entity):
                     elif self.vel.x < 0:
                         self.rect.left = solid.right
                     self.vel.x = 0
+                    self.remainder.x = 0
                 else:
                     if self.vel.y > 0:
                         self.rect.bottom = solid.top
@@ -180,6 +208,7 @@ class Player(Entity):
                     elif self.vel.y < 0:
                         self.rect.top = solid.bottom
                     self.vel.y = 0
+                    self.remainder.y = 0
 
     def can_attack(self):
         return self.attack_timer <= 0
@@ -210,14 +239,46 @@ class Enemy1(Entity):
         self.direction = -1
         self.hp = 1
         self.anim_timer = 0
+        # 스폰 후 첫 갱신에서 타일로 계산하는 순찰 구간 (지형 버전이나 높이가 바뀌면 다시 계산)
+        self.patrol = None
+        self.patrol_key = None
+
+    def fast_forward(self, elapsed):
+        self.anim_timer += elapsed
 
     def update(self, dt, world, player):
+        patrol_key = (world.terrain_version, self.rect.y)
+        if self.patrol_key != patrol_key:
+            self.patrol = find_patrol_bounds(world.tiles, self.rect)
+            self.patrol_key = patrol_key
         self.vel.x = self.direction * self.speed
-        self.rect.x += int(self.vel.x * dt)
+        self.rect.x += self.consume_motion(0, self.vel.x * dt)
         if abs(self.vel.x) > 1:
             self.anim_timer += dt
         else:
             self.anim_timer = 0
+        if self.patrol is None:
+            self._check_terrain(world)
+            return
+        # 미리 계산한 두 벽 사이를 왕복하고, 앞쪽 바닥은 저장해 둔 행에서 바로 확인 (solids 순회 없음)
+        wall_left, wall_right, floor = self.patrol
+        if self.vel.x > 0 and self.rect.right > wall_right:
+            self.rect.right = wall_right
+            self.direction *= -1
+            self.remainder.x = 0
+            return
+        if self.vel.x < 0 and self.rect.left < wall_left:
+            self.rect.left = wall_left
+            self.direction *= -1
+            self.remainder.x = 0
+            return
+        if floor is not None:
+            front_col = (self.rect.centerx + self.direction * 8) // TILE_SIZE
+            if 0 <= front_col < len(floor) and floor[front_col] != 1:
+                self.direction *= -1
+
+    def _check_terrain(self, world):
+        # 순찰 구간을 계산할 수 없을 때의 동적 판정
         hit_wall = False
         for solid in world.solids:
             if self.rect.colliderect(solid):
@@ -228,6 +289,7 @@ class Enemy1(Entity):
                     self.rect.left = solid.right
         if hit_wall:
             self.direction *= -1
+            self.remainder.x = 0
             return
         front_x = self.rect.centerx + self.direction * 8
         front_y = self.rect.bottom + 1
@@ -236,7 +298,7 @@ class Enemy1(Entity):
 
 
 class Enemy2(Entity):
-    def __init__(self, x, y, speed=80):
+    def __init__(self, x, y, speed=80, rng=random):
         super().__init__(x, y, 14, 14)
         self.speed = speed
         self.cooldown = 1.2
@@ -247,7 +309,18 @@ class Enemy2(Entity):
         self.hp = 1
         self.anim_timer = 0
         self.base_y = y
-        self.float_timer = random.uniform(0, 1)
+        self.float_timer = rng.uniform(0, 1)
+
+    def fast_forward(self, elapsed):
+        # 이동은 재현하지 않고, 돌진 중이었다면 끝난 것으로 보고 대기 타이머만 진행
+        self.float_timer += elapsed
+        self.anim_timer += elapsed
+        self.rect.y = self.base_y + int(2 * math.sin(self.float_timer * 3))
+        if self.dashing:
+            self.dashing = False
+            self.timer = self.cooldown
+        else:
+            self.timer -= elapsed
 
     def update(self, dt, world, player):
         self.timer -= dt
@@ -256,7 +329,7 @@ class Enemy2(Entity):
         self.anim_timer += dt
         if self.dashing:
             self.dash_time -= dt
-            self.rect.x += int(self.speed * 2.4 * self.direction * dt)
+            self.rect.x += self.consume_motion(0, self.speed * 2.4 * self.direction * dt)
             for solid in world.solids:
                 if self.rect.colliderect(solid):
                     if self.direction > 0:
@@ -265,6 +338,7 @@ class Enemy2(Entity):
                         self.rect.left = solid.right
                     self.dashing = False
                     self.timer = self.cooldown
+                    self.remainder.x = 0
             if self.dash_time <= 0:
                 self.dashing = False
                 self.timer = self.cooldown
@@ -277,319 +351,19 @@ class Enemy2(Entity):
 
 
 class Heart(Entity):
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random):
         super().__init__(x, y, 12, 12)
-        self.float_timer = random.uniform(0, 1)
+        self.float_timer = rng.uniform(0, 1)
         self.base_y = y
 
-    def update(self, dt, world, player):
-        self.float_timer += dt
-        self.rect.y = self.base_y + int(2 * math.sin(self.float_timer * 3))
-
-
-class BossAttack:
-    def __init__(self, rect, duration=0.35, damage=1, color=(220, 80, 80)):
-        self.rect = rect
-        self.timer = duration
-        self.damage = damage
-        self.color = color
-        self.active = True
-
-    def update(self, dt):
-        self.timer -= dt
-        if self.timer <= 0:
-            self.active = False
-
-
-class BossTelegraph:
-    def __init__(self, rect, duration=0.4, color=(220, 200, 80)):
-        self.rect = rect
-        self.timer = duration
-        self.active = True
-        self.color = color
-
-    def update(self, dt):
-        self.timer -= dt
-        if self.timer <= 0:
-            self.active = False
-
-
-class BossBase(Entity):
-    def __init__(self, x, y, width, height, hp):
-        super().__init__(x, y, width, height)
-        self.max_hp = hp
-        self.hp = hp
-        self.phase = 1
-        self.state = "idle"
-        self.state_timer = 0
-        self.attack_timer = 0
-        self.attacks = []
-        self.telegraphs = []
-        self.color = (160, 160, 180)
-
-    def update(self, dt, world, player):
-        self.state_timer = max(0, self.state_timer - dt)
-        for attack in list(self.attacks):
-            attack.update(dt)
-            if not attack.active:
-                self.attacks.remove(attack)
-        for telegraph in list(self.telegraphs):
-            telegraph.update(dt)
-            if not telegraph.active:
-                self.telegraphs.remove(telegraph)
-
-    def spawn_telegraph(self, rect, duration=0.4, color=(220, 200, 80)):
-        self.telegraphs.append(BossTelegraph(rect, duration, color))
-
-    def spawn_attack(self, rect, duration=0.35, damage=1, color=(220, 80, 80)):
-        self.attacks.append(BossAttack(rect, duration, damage, color))
-
-    def apply_damage(self, dmg):
-        self.hp = max(0, self.hp - dmg)
-        if self.hp == 0:
-            self.alive = False
-
-
-class DirectorBoss(BossBase):
-    def __init__(self, x, y):
-        super().__init__(x, y, 32, 40, hp=20)
-        self.color = (140, 110, 160)
-
-    def update(self, dt, world, player):
-        super().update(dt, world, player)
-        hp_ratio = self.hp / self.max_hp
-        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
-        self.attack_timer -= dt
-        if self.attack_timer > 0:
-            return
-
-        if self.phase == 1:
-            self._camera_beam(player, world)
-            self.attack_timer = 1.6
-        elif self.phase == 2:
-            if random.random() < 0.5:
-                self._spotlight(world)
-            else:
-                self._camera_beam(player, world)
-            self.attack_timer = 1.3
-        else:
-            roll = random.random()
-            if roll < 0.4:
-                self._camera_beam(player, world)
-            elif roll < 0.8:
-                self._spotlight(world)
-            else:
-                self._cut_command(player)
-            self.attack_timer = 1.1
-
-    def _camera_beam(self, player, world):
-        rect = pygame.Rect(world.camera_x if hasattr(world, "camera_x") else 0, player.rect.centery - 6, world.level_width, 12)
-        self.spawn_telegraph(rect, duration=0.4, color=(220, 120, 120))
-        self.spawn_attack(rect, duration=0.3, damage=2)
-
-    def _spotlight(self, world):
-        x = self.rect.centerx + random.randint(-80, 80)
-        y = self.rect.bottom + 20
-        rect = pygame.Rect(x - 18, y - 18, 36, 36)
-        self.spawn_telegraph(rect, duration=0.5, color=(220, 200, 100))
-        self.spawn_attack(rect, duration=0.35, damage=2, color=(220, 120, 80))
-
-    def _cut_command(self, player):
-        rect = pygame.Rect(player.rect.centerx - 10, player.rect.centery - 10, 20, 20)
-        self.spawn_telegraph(rect, duration=0.3, color=(200, 200, 200))
-        self.spawn_attack(rect, duration=0.2, damage=1, color=(200, 200, 220))
-
-
-class DancerBoss(BossBase):
-    def __init__(self, x, y):
-        super().__init__(x, y, 26, 38, hp=18)
-        self.color = (180, 80, 110)
-
-    def update(self, dt, world, player):
-        super().update(dt, world, player)
-        hp_ratio = self.hp / self.max_hp
-        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
-        self.attack_timer -= dt
-        if self.attack_timer > 0:
-            return
-
-        if self.phase == 1:
-            self._ribbon_slash(player)
-            self.attack_timer = 1.3
-        elif self.phase == 2:
-            if random.random() < 0.5:
-                self._dive_stab(player)
-            else:
-                self._ribbon_slash(player)
-            self.attack_timer = 1.1
-        else:
-            roll = random.random()
-            if roll < 0.4:
-                self._afterimage_fake(player)
-            elif roll < 0.7:
-                self._dive_stab(player)
-            else:
-                self._ribbon_slash(player)
-            self.attack_timer = 0.95
-
-    def _ribbon_slash(self, player):
-        direction = 1 if player.rect.centerx >= self.rect.centerx else -1
-        rect = pygame.Rect(self.rect.centerx + direction * 10, self.rect.centery - 12, 36, 24)
-        self.spawn_telegraph(rect, duration=0.3, color=(220, 150, 180))
-        self.spawn_attack(rect, duration=0.3, damage=2, color=(200, 80, 120))
-
-    def _dive_stab(self, player):
-        rect = pygame.Rect(player.rect.centerx - 12, player.rect.centery - 24, 24, 48)
-        self.spawn_telegraph(rect, duration=0.35, color=(200, 200, 220))
-        self.spawn_attack(rect, duration=0.25, damage=2, color=(160, 120, 220))
-
-    def _afterimage_fake(self, player):
-        rect = pygame.Rect(player.rect.centerx - 18, player.rect.centery - 12, 36, 24)
-        self.spawn_telegraph(rect, duration=0.2, color=(140, 140, 180))
-        self.spawn_attack(rect, duration=0.2, damage=2, color=(200, 80, 100))
-
-
-class JudgeBoss(BossBase):
-    def __init__(self, x, y):
-        super().__init__(x, y, 36, 44, hp=22)
-        self.color = (110, 140, 180)
-
-    def update(self, dt, world, player):
-        super().update(dt, world, player)
-        hp_ratio = self.hp / self.max_hp
-        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
-        self.attack_timer -= dt
-        if self.attack_timer > 0:
-            return
-
-        if self.phase == 1:
-            self._hammer_drop(player)
-            self.attack_timer = 1.5
-        elif self.phase == 2:
-            if random.random() < 0.5:
-                self._scale_verdict(player)
-            else:
-                self._hammer_drop(player)
-            self.attack_timer = 1.3
-        else:
-            roll = random.random()
-            if roll < 0.4:
-                self._scale_verdict(player)
-            elif roll < 0.8:
-                self._judgement_zone(player)
-            else:
-                self._hammer_drop(player)
-            self.attack_timer = 1.1
-
-    def _hammer_drop(self, player):
-        rect = pygame.Rect(player.rect.centerx - 16, player.rect.centery - 20, 32, 40)
-        self.spawn_telegraph(rect, duration=0.6, color=(200, 180, 120))
-        self.spawn_attack(rect, duration=0.3, damage=2, color=(180, 120, 80))
-
-    def _scale_verdict(self, player):
-        left_rect = pygame.Rect(player.rect.centerx - 70, player.rect.centery - 16, 40, 32)
-        right_rect = pygame.Rect(player.rect.centerx + 30, player.rect.centery - 16, 40, 32)
-        danger = left_rect if random.random() < 0.5 else right_rect
-        self.spawn_telegraph(danger, duration=0.45, color=(200, 120, 120))
-        self.spawn_attack(danger, duration=0.35, damage=2, color=(160, 80, 80))
-
-    def _judgement_zone(self, player):
-        rect = pygame.Rect(player.rect.centerx - 50, player.rect.centery - 10, 100, 20)
-        self.spawn_telegraph(rect, duration=0.4, color=(180, 200, 200))
-        self.spawn_attack(rect, duration=0.5, damage=1, color=(140, 180, 180))
-
-
-class ClownBoss(BossBase):
-    def __init__(self, x, y):
-        super().__init__(x, y, 30, 36, hp=19)
-        self.color = (200, 120, 80)
+    def bounds(self):
+        # 위아래로 떠다니는 전체 범위 (공간 해시 등록용)
+        return pygame.Rect(self.rect.x, self.base_y - 2, self.rect.width, self.rect.height + 4)
 
-    def update(self, dt, world, player):
-        super().update(dt, world, player)
-        hp_ratio = self.hp / self.max_hp
-        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
-        self.attack_timer -= dt
-        if self.attack_timer > 0:
-            return
-
-        if self.phase == 1:
-            self._flip_charge(player)
-            self.attack_timer = 1.4
-        elif self.phase == 2:
-            if random.random() < 0.5:
-                self._clone_slash(player)
-            else:
-                self._flip_charge(player)
-            self.attack_timer = 1.2
-        else:
-            roll = random.random()
-            if roll < 0.4:
-                self._wire_mandate(player)
-            elif roll < 0.8:
-                self._clone_slash(player)
-            else:
-                self._flip_charge(player)
-            self.attack_timer = 1.0
-
-    def _flip_charge(self, player):
-        rect = pygame.Rect(player.rect.centerx - 30, player.rect.centery - 10, 60, 20)
-        self.spawn_telegraph(rect, duration=0.4, color=(200, 140, 80))
-        self.spawn_attack(rect, duration=0.3, damage=2, color=(200, 90, 60))
-
-    def _clone_slash(self, player):
-        rect = pygame.Rect(player.rect.centerx - 20, player.rect.centery - 20, 40, 40)
-        self.spawn_telegraph(rect, duration=0.35, color=(140, 140, 140))
-        self.spawn_attack(rect, duration=0.3, damage=2, color=(180, 60, 60))
-
-    def _wire_mandate(self, player):
-        rect = pygame.Rect(player.rect.centerx - 80, player.rect.centery - 6, 160, 12)
-        self.spawn_telegraph(rect, duration=0.4, color=(220, 100, 100))
-        self.spawn_attack(rect, duration=0.35, damage=2, color=(200, 60, 80))
-
-
-class ArchivistBoss(BossBase):
-    def __init__(self, x, y):
-        super().__init__(x, y, 40, 46, hp=24)
-        self.color = (100, 140, 120)
+    def fast_forward(self, elapsed):
+        self.float_timer += elapsed
+        self.rect.y = self.base_y + int(2 * math.sin(self.float_timer * 3))
 
     def update(self, dt, world, player):
-        super().update(dt, world, player)
-        hp_ratio = self.hp / self.max_hp
-        self.phase = 1 if hp_ratio > 0.7 else 2 if hp_ratio > 0.3 else 3
-        self.attack_timer -= dt
-        if self.attack_timer > 0:
-            return
-
-        if self.phase == 1:
-            self._page_storm(player)
-            self.attack_timer = 1.6
-        elif self.phase == 2:
-            if random.random() < 0.5:
-                self._shelf_press(player)
-            else:
-                self._page_storm(player)
-            self.attack_timer = 1.3
-        else:
-            roll = random.random()
-            if roll < 0.4:
-                self._time_stasis(player)
-            elif roll < 0.8:
-                self._shelf_press(player)
-            else:
-                self._page_storm(player)
-            self.attack_timer = 1.1
-
-    def _page_storm(self, player):
-        rect = pygame.Rect(player.rect.centerx - 60, player.rect.centery - 16, 120, 32)
-        self.spawn_telegraph(rect, duration=0.35, color=(160, 200, 160))
-        self.spawn_attack(rect, duration=0.4, damage=2, color=(120, 160, 120))
-
-    def _shelf_press(self, player):
-        rect = pygame.Rect(player.rect.centerx - 90, player.rect.centery - 24, 180, 48)
-        self.spawn_telegraph(rect, duration=0.45, color=(160, 120, 80))
-        self.spawn_attack(rect, duration=0.35, damage=2, color=(120, 90, 60))
-
-    def _time_stasis(self, player):
-        rect = pygame.Rect(player.rect.centerx - 30, player.rect.centery - 30, 60, 60)
-        self.spawn_telegraph(rect, duration=0.4, color=(140, 180, 220))
-        self.spawn_attack(rect, duration=0.3, damage=1, color=(100, 140, 200))
+        self.float_timer += dt
+        self.rect.y = self.base_y + int(2 * math.sin(self.float_timer * 3))
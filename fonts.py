@@ -0,0 +1,56 @@
+import json
+import os
+
+import pygame
+
+FONT_NAME = "malgungothic"
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "assets")
+# 찾은 폰트 경로(없으면 null = 기본 폰트)를 저장, 지우면 다음 실행에서 다시 찾는다
+FONT_CACHE_FILE = "font_cache.json"
+
+_UNRESOLVED = object()
+_font_path = _UNRESOLVED
+_fonts = {}
+
+
+def resolve_font_path():
+    # 시스템 폰트 목록(fontconfig) 스캔은 처음 한 번만 하고 결과를 파일에 남긴다
+    global _font_path
+    if _font_path is not _UNRESOLVED:
+        return _font_path
+    cache_path = os.path.join(CACHE_DIR, FONT_CACHE_FILE)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+        path = cached["path"]
+        if cached["name"] == FONT_NAME and (path is None or os.path.exists(path)):
+            _font_path = path
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    try:
+        path = pygame.font.match_font(FONT_NAME)
+    except Exception:
+        path = None
+    _font_path = path
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as handle:
+            json.dump({"name": FONT_NAME, "path": path}, handle, ensure_ascii=False)
+    except OSError as exc:
+        print(f"[fonts] 폰트 경로 저장 실패: {exc}")
+    return path
+
+
+def load_font(size):
+    # 크기별 Font 객체를 한 번만 만들어 공유 (찾지 못하면 pygame 기본 폰트)
+    font = _fonts.get(size)
+    if font is None:
+        path = resolve_font_path()
+        try:
+            font = pygame.font.Font(path, size)
+        except (OSError, pygame.error):
+            font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
@@ -1,33 +1,47 @@
+import hashlib
 import random
+import time
 import pygame
 
-from assets import build_assets, load_font
+from assets import AssetLoader, build_assets, load_title_assets
+from fonts import load_font
 from entities import (
     Player,
     Enemy1,
     Enemy2,
     Heart,
-    Particle,
-    DirectorBoss,
-    DancerBoss,
-    JudgeBoss,
-    ClownBoss,
-    ArchivistBoss,
 )
 from platformer_world import (
     TILE_SIZE,
     LEVEL_PIXEL_H,
-    LEVEL_PIXEL_W,
     KILL_Y,
     STAGE_LINES,
     build_map,
-    build_solid_rects,
+    build_merged_solid_rects,
+    solid_rects_in,
     build_signs,
     build_checkpoints,
+    Checkpoint,
     STAGE_SPAWNS,
 )
+from particles import ParticleSystem, build_solid_grid
+from culling import IntervalIndex, camera_rect, clip_to_view
+from presentation import Presenter
+from spatial_hash import SpatialHash
+from startup_trace import StartupTrace
+from render_queue import RenderQueue
+from profiler import FrameProfiler
+from text_cache import render_text
+from tile_layer import TileLayer
 from ui import HUD, HintBox, TitleRenderer, draw_help
-from setting import BOSS_ACTIVATION_DISTANCE, SCREEN_SCALE
+from setting import (
+    ACTIVATION_MARGIN,
+    BOSS_ACTIVATION_DISTANCE,
+    FIXED_TIMESTEP,
+    SLEEP_FAST_FORWARD,
+    SIMULATION_HZ,
+    MAX_CATCH_UP_STEPS,
+)
 
 
 STATE_TITLE = "title"
@@ -35,23 +49,71 @@ STATE_HELP = "help"
 STATE_PLAYING = "playing"
 STATE_GAME_OVER = "game_over"
 STATE_VICTORY = "victory"
+# 화면이 거의 바뀌지 않아 부분 갱신으로 그리는 상태
+STATIC_STATES = (STATE_TITLE, STATE_HELP, STATE_GAME_OVER, STATE_VICTORY)
+
+# draw_world에서 그리는 순서대로의 렌더 큐 레이어
+RENDER_LAYERS = ("props", "hearts", "enemies", "boss", "goal", "player", "attacks")
+
+PROFILE_SECTIONS = (
+    "events",
+    "player",
+    "enemies",
+    "boss",
+    "hearts",
+    "particles",
+    "draw_world",
+    "text",
+    "hud",
+    "hint",
+    "scale",
+    "flip",
+)
 
 
 class World:
-    def __init__(self):
-        self.tiles = build_map()
-        self.solids = build_solid_rects(self.tiles)
+    def __init__(self, tiles=None):
+        self.tiles = tiles if tiles is not None else build_map()
+        self.level_width = len(self.tiles[0]) * TILE_SIZE
+        self.level_height = len(self.tiles) * TILE_SIZE
+        # 적 충돌용 solids는 병합된 직사각형 목록을 사용
+        self.solids = build_merged_solid_rects(self.tiles)
+        self.solid_grid = build_solid_grid(self.tiles)
+        # 지형이 바뀔 때마다 올려서 타일 기반 캐시(순찰 구간 등)를 다시 계산하게 한다
+        self.terrain_version = 0
         self.enemies = []
         self.hearts = []
+        # 하트는 추가/제거 시, 체크포인트는 생성 시 한 번 공간 해시에 등록
+        self.heart_hash = SpatialHash()
         self.signs = build_signs()
         self.checkpoints = build_checkpoints()
-        self.goal_rect = pygame.Rect(LEVEL_PIXEL_W - TILE_SIZE * 3, TILE_SIZE * 4, TILE_SIZE, TILE_SIZE * 3)
+        self.checkpoint_hash = SpatialHash()
+        for checkpoint in self.checkpoints:
+            self.checkpoint_hash.insert(checkpoint)
+        self.goal_rect = pygame.Rect(self.level_width - TILE_SIZE * 3, TILE_SIZE * 4, TILE_SIZE, TILE_SIZE * 3)
         self.boss = None
-        self.level_width = LEVEL_PIXEL_W
         self.camera_x = 0
 
+    def mark_terrain_changed(self):
+        # tiles를 직접 고친 뒤 호출: 충돌 데이터를 다시 만들고 지형 버전을 올린다
+        self.solids = build_merged_solid_rects(self.tiles)
+        self.solid_grid = build_solid_grid(self.tiles)
+        self.terrain_version += 1
+
+    def solids_in(self, rect):
+        # 전체 solids 대신 타일 격자에서 rect와 겹치는 고체 타일만 조회
+        return solid_rects_in(self.tiles, rect)
+
+    def add_heart(self, heart):
+        self.hearts.append(heart)
+        self.heart_hash.insert(heart, heart.bounds())
+
+    def remove_heart(self, heart):
+        self.hearts.remove(heart)
+        self.heart_hash.remove(heart)
+
     def is_solid_at(self, x, y):
-        if x < 0 or y < 0 or x >= LEVEL_PIXEL_W or y >= LEVEL_PIXEL_H:
+        if x < 0 or y < 0 or x >= self.level_width or y >= self.level_height:
             return True
         tile_x = int(x // TILE_SIZE)
         tile_y = int(y // TILE_SIZE)
@@ -62,31 +124,70 @@ class World:
 
 
 class Game:
-    def __init__(self, screen, render_surface):
+    def __init__(self, screen, render_surface, seed=None, stream_assets=False, trace=None):
+        # stream_assets: 게임플레이 에셋을 백그라운드에서 읽고 타이틀 화면부터 먼저 띄운다
+        # trace: 시작 구간 기록 (main.py가 임포트/창 생성 구간을 채워 넘긴다)
+        self.trace = trace if trace is not None else StartupTrace()
+        self.asset_loader = AssetLoader() if stream_assets else None
+        # 시작 추적이 끝나면 바로 종료 (시작 시간 측정용)
+        self.exit_after_startup = False
         self.screen = screen
         self.render_surface = render_surface
+        # 세션 단위 시드 RNG (게임플레이용), 화면 흔들림 같은 연출은 별도 RNG 사용
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.fx_rng = random.Random()
+        self.recorder = None
+        self.telemetry = None
+        self.last_keys = None
+        # 구간별 프레임 시간 측정 (F3로 오버레이 토글)
+        self.profiler = FrameProfiler()
+        for name in PROFILE_SECTIONS:
+            self.profiler.register(name)
         self.clock = pygame.time.Clock()
-        # 에셋/폰트 로드 및 기본 상태 설정
-        self.assets = build_assets()
-        self.font = load_font(12)
-        self.big_font = load_font(20)
+        # 키 상태 조회 함수 (헤드리스/재생 시 교체)
+        self.key_source = pygame.key.get_pressed
+        # 에셋/폰트 로드 및 기본 상태 설정 (타이틀 이미지는 항상 바로 읽는다)
+        trace = self.trace
+        with trace.phase("title_assets"):
+            self.assets = load_title_assets()
+        if self.asset_loader is None:
+            with trace.phase("build_assets"):
+                self.assets.update(build_assets())
+        with trace.phase("fonts"):
+            self.font = load_font(12)
+            self.big_font = load_font(20)
         self.state = STATE_TITLE
-        self.world = World()
-        self.player = Player(TILE_SIZE * 2, LEVEL_PIXEL_H - TILE_SIZE * 4)
-        self.hud = HUD(self.font)
-        self.hint_box = HintBox(load_font(8))
-        self.title_renderer = TitleRenderer(
-            self.render_surface.get_width(),
-            self.render_surface.get_height(),
-            background=self.assets.get("title_bg"),
-            title_image=self.assets.get("title_text"),
-        )
+        with trace.phase("world"):
+            self.world = World()
+            self.player = Player(TILE_SIZE * 2, LEVEL_PIXEL_H - TILE_SIZE * 4)
+        with trace.phase("ui"):
+            self.hud = HUD(self.font)
+            self.hint_box = HintBox(load_font(8))
+            self.profiler_font = load_font(14)
+            self.presenter = Presenter(self.render_surface.get_size())
+            self.render_queue = RenderQueue(RENDER_LAYERS)
+            self.title_renderer = TitleRenderer(
+                self.render_surface.get_width(),
+                self.render_surface.get_height(),
+                background=self.assets.get("title_bg"),
+                title_image=self.assets.get("title_text"),
+            )
+        # 정적 화면에서 마지막으로 화면에 내보낸 내용 (None이면 전체 다시 그림)
+        self.static_key = None
+        self.static_blink = False
         self.camera_x = 0
+        self.prev_camera_x = 0
+        self.fixed_dt = 1.0 / SIMULATION_HZ
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
         self.stage_text = ""
         self.stage_timer = 0
         self.message = ""
         self.attack_hitboxes = []
-        self.particles = []
+        # 틱마다 다시 채우는 공격 판정 공간 해시
+        self.hitbox_hash = SpatialHash()
+        self.particles = ParticleSystem()
         self.notice = ""
         self.notice_timer = 0
         self.hitstop_timer = 0
@@ -98,20 +199,52 @@ class Game:
         self.enemy_speed_scale = 1.0
         self.enemy_damage = 1
         self.respawn_point = pygame.Vector2(self.player.rect.x, self.player.rect.y)
+        # 스트리밍 중이면 첫 스테이지는 에셋이 도착한 뒤 poll_assets에서 준비
+        if self.asset_loader is None:
+            self.reset_stage()
+            trace.mark_ready()
+
+    def poll_assets(self, wait=False):
+        # 백그라운드 로딩이 끝났으면 게임플레이 에셋을 합치고 첫 스테이지를 준비, 준비됐으면 True
+        if self.asset_loader is None:
+            return True
+        if not wait and not self.asset_loader.done():
+            return False
+        self._merge_assets()
         self.reset_stage()
+        self.trace.mark_ready()
+        return True
 
-    def reset_stage(self):
-        # 스테이지 상태 초기화 및 스폰 데이터 적용
-        self.world = World()
+    def _merge_assets(self):
+        # 로더 결과를 기다려 합치기만 한다 (스테이지 준비는 호출한 쪽 몫)
+        loader = self.asset_loader
+        self.asset_loader = None
+        # 화면 포맷 변환/자르기/아틀라스는 여기서 메인 스레드로 한다 (아직 로딩 중이면 기다린 시간 포함)
+        with self.trace.phase("merge_assets"):
+            self.assets.update(loader.result())
+        self.trace.add("build_assets", loader.started_at, loader.finished_at, background=True)
+
+    def reset_stage(self, tiles=None):
+        # 스테이지 상태 초기화 및 스폰 데이터 적용 (tiles를 주면 해당 맵 사용)
+        if self.asset_loader is not None:
+            # 로딩이 끝나기 전에 시작하면 남은 에셋만 기다린다
+            # 미뤄 둔 첫 스테이지 준비는 이번 호출이 대신한다 (reseed 직후라면 난수를 한 스테이지 분만 소비)
+            self._merge_assets()
+            stage_pending = True
+        else:
+            stage_pending = False
+        stage_start = time.perf_counter()
+        self.world = World(tiles)
         self.player = Player(TILE_SIZE * 2, LEVEL_PIXEL_H - TILE_SIZE * 4)
         self.camera_x = 0
-        self.stage_text = random.choice(STAGE_LINES)
+        self.prev_camera_x = 0
+        self.stage_text = self.rng.choice(STAGE_LINES)
         self.stage_timer = 1.4
         self.message = ""
         self.notice = ""
         self.notice_timer = 0
         self.attack_hitboxes = []
-        self.particles = []
+        self.particles.clear()
         self.hitstop_timer = 0
         self.shake_timer = 0
         self.shake_strength = 0
@@ -125,11 +258,30 @@ class Game:
             if kind == "enemy1":
                 self.world.enemies.append(Enemy1(x, y, speed=60 * self.enemy_speed_scale))
             else:
-                self.world.enemies.append(Enemy2(x, y, speed=85 * self.enemy_speed_scale))
-        self.world.hearts = [Heart(x, y) for x, y in stage["hearts"]]
+                self.world.enemies.append(Enemy2(x, y, speed=85 * self.enemy_speed_scale, rng=self.rng))
+        for x, y in stage["hearts"]:
+            self.world.add_heart(Heart(x, y, rng=self.rng))
         self.world.boss = self._create_boss(stage["boss"])
+        self.tile_layer = self._build_tile_layer()
+        # 화면 컬링용 x 정렬 인덱스 (표지판/체크포인트는 고정, 하트는 목록이 바뀌면 다시 만든다)
+        self.prop_index = IntervalIndex(self.world.signs + self.world.checkpoints)
+        self.heart_index = None
+        self.trace.add("stage", stage_start, time.perf_counter())
+        if stage_pending:
+            self.trace.mark_ready()
+
+    def _build_tile_layer(self):
+        # 배경과 지형은 정적이므로 스테이지 시작 시 청크로 구워 둔다
+        bg = self.assets["bg"]
+        if bg.get_height() != self.render_surface.get_height():
+            scale_w = int(bg.get_width() * (self.render_surface.get_height() / max(1, bg.get_height())))
+            bg = pygame.transform.scale(bg, (max(1, scale_w), self.render_surface.get_height()))
+        return TileLayer(self.world.tiles, self.assets["tile_floor"], self.assets["tile_wall"], background=bg)
 
     def _create_boss(self, boss_data):
+        # 보스 모듈은 첫 스테이지를 만들 때 불러온다 (타이틀 첫 프레임까지의 임포트에서 제외)
+        from bosses import DirectorBoss, DancerBoss, JudgeBoss, ClownBoss, ArchivistBoss
+
         boss_map = {
             "director": DirectorBoss,
             "dancer": DancerBoss,
@@ -138,7 +290,7 @@ class Game:
             "archivist": ArchivistBoss,
         }
         boss_cls = boss_map.get(boss_data["name"], DirectorBoss)
-        return boss_cls(boss_data["x"], boss_data["y"])
+        return boss_cls(boss_data["x"], boss_data["y"], rng=self.rng)
 
     def apply_difficulty(self):
         if self.difficulty == "hard":
@@ -153,43 +305,56 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                self.static_key = None
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == STATE_HELP:
-                        self.state = STATE_TITLE
-                        return True
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    self.presenter.invalidate()
+                    continue
+                if not self.handle_key_down(event.key):
                     return False
-                if self.state == STATE_TITLE:
-                    if event.key == pygame.K_RETURN:
-                        self.state = STATE_PLAYING
-                        self.reset_stage()
-                    elif event.key == pygame.K_e:
-                        self.state = STATE_HELP
-                    elif event.key == pygame.K_1:
-                        self.difficulty = "easy"
-                        self.state = STATE_PLAYING
-                        self.reset_stage()
-                    elif event.key == pygame.K_2:
-                        self.difficulty = "hard"
-                        self.state = STATE_PLAYING
-                        self.reset_stage()
-                elif self.state == STATE_HELP:
-                    if event.key == pygame.K_UP:
-                        self.state = STATE_TITLE
-                elif self.state in (STATE_GAME_OVER, STATE_VICTORY):
-                    if event.key == pygame.K_r:
-                        self.state = STATE_TITLE
-                        self.reset_stage()
-                elif self.state == STATE_PLAYING:
-                    if event.key == pygame.K_e:
-                        self.try_read_sign()
-                if self.state == STATE_PLAYING and event.key == pygame.K_SPACE:
-                    self.player.jump()
-            if event.type == pygame.KEYDOWN and self.state == STATE_PLAYING:
-                if event.key == pygame.K_r:
-                    hitbox = self.player.create_attack_hitbox()
-                    if hitbox:
-                        self.attack_hitboxes.append(hitbox)
+        return True
+
+    def handle_key_down(self, key):
+        # 키 입력 하나를 처리, 종료 요청이면 False 반환 (헤드리스 입력 재생에서도 사용)
+        if self.recorder:
+            self.recorder.key_down(key)
+        if key == pygame.K_ESCAPE:
+            if self.state == STATE_HELP:
+                self.state = STATE_TITLE
+                return True
+            return False
+        if self.state == STATE_TITLE:
+            if key == pygame.K_RETURN:
+                self.state = STATE_PLAYING
+                self.reset_stage()
+            elif key == pygame.K_e:
+                self.state = STATE_HELP
+            elif key == pygame.K_1:
+                self.difficulty = "easy"
+                self.state = STATE_PLAYING
+                self.reset_stage()
+            elif key == pygame.K_2:
+                self.difficulty = "hard"
+                self.state = STATE_PLAYING
+                self.reset_stage()
+        elif self.state == STATE_HELP:
+            if key == pygame.K_UP:
+                self.state = STATE_TITLE
+        elif self.state in (STATE_GAME_OVER, STATE_VICTORY):
+            if key == pygame.K_r:
+                self.state = STATE_TITLE
+                self.reset_stage()
+        elif self.state == STATE_PLAYING:
+            if key == pygame.K_e:
+                self.try_read_sign()
+        if self.state == STATE_PLAYING and key == pygame.K_SPACE:
+            self.player.jump()
+        if self.state == STATE_PLAYING and key == pygame.K_r:
+            hitbox = self.player.create_attack_hitbox()
+            if hitbox:
+                self.attack_hitboxes.append(hitbox)
         return True
 
     def try_read_sign(self):
@@ -199,20 +364,75 @@ class Game:
                 self.notice_timer = 2.2
                 return
 
+    def snapshot(self):
+        # 이전 틱 위치를 저장해 두고 렌더링 시 현재 위치와 보간
+        self.prev_camera_x = self.camera_x
+        self.player.snapshot()
+        # 한 틱 이상 잠든 개체는 위치가 그대로이므로 건너뛴다
+        for enemy in self.world.enemies:
+            if not enemy.sleep_time:
+                enemy.snapshot()
+        for heart in self.world.hearts:
+            if not heart.sleep_time:
+                heart.snapshot()
+
     def update(self, dt):
         # 게임 플레이 중 갱신 로직
+        keys = self.key_source()
+        self.last_keys = keys
+        if self.recorder:
+            self.recorder.tick(keys)
         if self.state != STATE_PLAYING:
             return
+        self.snapshot()
 
         if self.hitstop_timer > 0:
             self.hitstop_timer = max(0, self.hitstop_timer - dt)
             return
 
-        keys = pygame.key.get_pressed()
+        profiler = self.profiler
+        with profiler.section("player"):
+            self.update_player(dt, keys)
+        with profiler.section("enemies"):
+            self.update_enemies(dt)
+        with profiler.section("boss"):
+            self.update_boss(dt)
+        with profiler.section("hearts"):
+            self.update_hearts(dt)
+        with profiler.section("particles"):
+            self.update_particles(dt)
+
+        for checkpoint in self.world.checkpoint_hash.query(self.player.rect):
+            if self.respawn_point.x != checkpoint.rect.x or self.respawn_point.y != checkpoint.rect.y:
+                self.respawn_point = pygame.Vector2(checkpoint.rect.x, checkpoint.rect.y)
+                self.notice = f"{checkpoint.label} 저장됨"
+                self.notice_timer = 1.5
+
+        if self.player.rect.y > KILL_Y:
+            self.respawn_player()
+
+        if self.player.rect.colliderect(self.world.goal_rect) and (not self.world.boss or not self.world.boss.alive):
+            self.state = STATE_VICTORY
+            self.clear_time = self.play_time
+            self.message = f"막이 내렸다. 등급 {self.calculate_rank()}"
+
+        if self.stage_timer > 0:
+            self.stage_timer -= dt
+
+        if self.notice_timer > 0:
+            self.notice_timer -= dt
+
+        if self.shake_timer > 0:
+            self.shake_timer = max(0, self.shake_timer - dt)
+
+        self.play_time += dt
+        self.update_camera()
+
+    def update_player(self, dt, keys):
         self.player.handle_input(dt, keys)
         self.player.try_dash(keys)
         self.player.apply_gravity(dt, keys[pygame.K_SPACE])
-        self.player.move_and_collide(dt, self.world.solids)
+        self.player.move_and_collide(dt, self.world)
         self.player.update(dt, self.world, self.player)
 
         for hitbox in list(self.attack_hitboxes):
@@ -220,18 +440,25 @@ class Game:
             if not hitbox.active:
                 self.attack_hitboxes.remove(hitbox)
 
+    def update_enemies(self, dt):
+        hitbox_hash = self.hitbox_hash
+        hitbox_hash.clear()
+        for hitbox in self.attack_hitboxes:
+            hitbox_hash.insert(hitbox)
+        left, right = self.activation_span()
         for enemy in list(self.world.enemies):
+            if not enemy.update_activation(left, right, dt, SLEEP_FAST_FORWARD):
+                continue
             enemy.update(dt, self.world, self.player)
-            for hitbox in self.attack_hitboxes:
-                if hitbox.rect.colliderect(enemy.rect):
-                    enemy.alive = False
-                    self.spawn_blood(enemy.rect.centerx, enemy.rect.centery)
-                    self.hitstop_timer = 0.05
-                    self.shake_timer = 0.2
-                    self.shake_strength = 4
-                    if random.random() < 0.35:
-                        self.world.hearts.append(Heart(enemy.rect.centerx, enemy.rect.centery))
-                    break
+            if hitbox_hash.entries and hitbox_hash.query(enemy.rect):
+                enemy.alive = False
+                self.spawn_blood(enemy.rect.centerx, enemy.rect.centery)
+                self.hitstop_timer = 0.05
+                self.shake_timer = 0.2
+                self.shake_strength = 4
+                if self.rng.random() < 0.35:
+                    self.world.add_heart(Heart(enemy.rect.centerx, enemy.rect.centery, rng=self.rng))
+                    self.heart_index = None
             if self.player.rect.colliderect(enemy.rect):
                 if self.player.take_damage(self.enemy_damage):
                     self.player.vel.x = -self.player.facing * 160
@@ -244,16 +471,16 @@ class Game:
                 if enemy in self.world.enemies:
                     self.world.enemies.remove(enemy)
 
+    def update_boss(self, dt):
         if self.world.boss and self.world.boss.alive:
             boss_distance = abs(self.player.rect.centerx - self.world.boss.rect.centerx)
-            boss_active = boss_distance <= BOSS_ACTIVATION_DISTANCE or self.player.rect.x > LEVEL_PIXEL_W - TILE_SIZE * 18
+            boss_active = boss_distance <= BOSS_ACTIVATION_DISTANCE or self.player.rect.x > self.world.level_width - TILE_SIZE * 18
             if boss_active:
                 self.world.boss.update(dt, self.world, self.player)
-            for attack in self.world.boss.attacks:
-                if attack.rect.colliderect(self.player.rect):
-                    if self.player.take_damage(attack.damage):
-                        self.shake_timer = 0.2
-                        self.shake_strength = 4
+            for attack in self.world.boss.attack_hash.query(self.player.rect):
+                if self.player.take_damage(attack.damage):
+                    self.shake_timer = 0.2
+                    self.shake_strength = 4
             if self.player.rect.colliderect(self.world.boss.rect) and self.player.take_damage(1):
                 self.player.vel.x = -self.player.facing * 180
                 self.player.vel.y = -160
@@ -262,43 +489,50 @@ class Game:
                 self.clear_time = self.play_time
                 self.message = f"막이 내렸다. 등급 {self.calculate_rank()}"
 
-        for heart in list(self.world.hearts):
-            heart.update(dt, self.world, self.player)
-            if self.player.rect.colliderect(heart.rect):
-                self.player.hp = min(self.player.max_hp, self.player.hp + 1)
-                self.world.hearts.remove(heart)
-
-        for particle in list(self.particles):
-            particle.update(dt)
-            if not particle.alive():
-                self.particles.remove(particle)
-
-        for checkpoint in self.world.checkpoints:
-            if self.player.rect.colliderect(checkpoint.rect):
-                if self.respawn_point.x != checkpoint.rect.x or self.respawn_point.y != checkpoint.rect.y:
-                    self.respawn_point = pygame.Vector2(checkpoint.rect.x, checkpoint.rect.y)
-                    self.notice = f"{checkpoint.label} 저장됨"
-                    self.notice_timer = 1.5
-
-        if self.player.rect.y > KILL_Y:
-            self.respawn_player()
-
-        if self.player.rect.colliderect(self.world.goal_rect) and (not self.world.boss or not self.world.boss.alive):
-            self.state = STATE_VICTORY
-            self.clear_time = self.play_time
-            self.message = f"막이 내렸다. 등급 {self.calculate_rank()}"
-
-        if self.stage_timer > 0:
-            self.stage_timer -= dt
-
-        if self.notice_timer > 0:
-            self.notice_timer -= dt
-
-        if self.shake_timer > 0:
-            self.shake_timer = max(0, self.shake_timer - dt)
+    def activation_span(self):
+        # 화면 좌우로 ACTIVATION_MARGIN만큼 넓힌 구간 안의 적/하트만 갱신
+        if ACTIVATION_MARGIN is None:
+            return float("-inf"), float("inf")
+        left = self.camera_x - ACTIVATION_MARGIN
+        return left, left + self.render_surface.get_width() + ACTIVATION_MARGIN * 2
 
-        self.play_time += dt
-        self.update_camera()
+    def update_hearts(self, dt):
+        left, right = self.activation_span()
+        for heart in self.world.hearts:
+            if heart.update_activation(left, right, dt, SLEEP_FAST_FORWARD):
+                heart.update(dt, self.world, self.player)
+        for heart in self.world.heart_hash.query(self.player.rect):
+            self.player.hp = min(self.player.max_hp, self.player.hp + 1)
+            self.world.remove_heart(heart)
+            self.heart_index = None
+
+    def update_particles(self, dt):
+        self.particles.update(dt)
+        # 타일에 닿은 핏방울은 살아 있는 파티클에서 빼고 정적 레이어에 얼룩으로 남긴다
+        blood = self.assets["blood"]
+        landed = self.particles.collide(self.world.solid_grid, TILE_SIZE, blood.get_size(), dt)
+        if landed is not None:
+            self.tile_layer.stamp(blood, landed.tolist())
+
+    def reseed(self, seed):
+        self.seed = seed
+        self.rng.seed(seed)
+
+    def state_digest(self):
+        # 재생 결과가 기록과 비트 단위로 같은지 확인하기 위한 상태 요약
+        boss = self.world.boss
+        state = (
+            self.state,
+            self.play_time,
+            tuple(self.player.rect),
+            (self.player.vel.x, self.player.vel.y),
+            self.player.hp,
+            tuple(tuple(enemy.rect) for enemy in self.world.enemies),
+            tuple(tuple(heart.rect) for heart in self.world.hearts),
+            (boss.hp, tuple(boss.rect)) if boss else None,
+            self.rng.getstate(),
+        )
+        return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
 
     def calculate_rank(self):
         if self.clear_time <= 55:
@@ -318,105 +552,138 @@ class Game:
         self.player.dash_invincible_timer = 0
         self.player.on_ground = False
         self.player.jumps_remaining = self.player.max_jumps
-        self.camera_x = max(0, min(self.player.rect.centerx - self.render_surface.get_width() // 2, LEVEL_PIXEL_W - self.render_surface.get_width()))
+        self.camera_x = max(0, min(self.player.rect.centerx - self.render_surface.get_width() // 2, self.world.level_width - self.render_surface.get_width()))
+        # 순간이동이므로 보간하지 않는다
+        self.player.snapshot()
+        self.prev_camera_x = self.camera_x
         self.notice = "다시 연기했다."
         self.notice_timer = 1.4
 
     def spawn_blood(self, x, y):
-        for _ in range(12):
-            self.particles.append(Particle(x, y))
+        self.particles.emit(x, y, 12, rng=self.rng)
 
     def update_camera(self):
         view_w = self.render_surface.get_width()
         target = self.player.rect.centerx - view_w // 2
-        self.camera_x = max(0, min(target, LEVEL_PIXEL_W - view_w))
+        self.camera_x = max(0, min(target, self.world.level_width - view_w))
         self.world.camera_x = self.camera_x
 
     def draw_world(self):
         # 배경, 지형, 적/플레이어 등 월드 렌더링
-        bg = self.assets["bg"]
-        if bg.get_height() != self.render_surface.get_height():
-            scale_w = int(bg.get_width() * (self.render_surface.get_height() / max(1, bg.get_height())))
-            bg = pygame.transform.scale(bg, (max(1, scale_w), self.render_surface.get_height()))
-        for x in range(0, LEVEL_PIXEL_W, bg.get_width()):
-            self.render_surface.blit(bg, (x - self.camera_x, 0))
-
-        floor = self.assets["tile_floor"]
-        wall = self.assets["tile_wall"]
-        for y, row in enumerate(self.world.tiles):
-            for x, tile in enumerate(row):
-                if tile == 1:
-                    self.render_surface.blit(wall, (x * TILE_SIZE - self.camera_x, y * TILE_SIZE))
-                else:
-                    self.render_surface.blit(floor, (x * TILE_SIZE - self.camera_x, y * TILE_SIZE))
-
-        for sign in self.world.signs:
-            pygame.draw.rect(self.render_surface, (80, 80, 120), sign.rect.move(-self.camera_x, 0))
-
-        for checkpoint in self.world.checkpoints:
-            color = (200, 200, 120) if self.respawn_point.x == checkpoint.rect.x else (120, 140, 160)
-            pygame.draw.rect(self.render_surface, color, checkpoint.rect.move(-self.camera_x, 0))
-
-        for heart in self.world.hearts:
-            self.render_surface.blit(self.assets["heart"], (heart.rect.x - self.camera_x, heart.rect.y))
-
+        alpha = self.render_alpha
+        camera_x = round(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+        self.tile_layer.draw(self.render_surface, camera_x)
+
+        queue = self.render_queue
+        # 화면과 겹치는 것만 큐에 넣는다 (레벨 크기와 무관하게 보이는 개수에만 비례)
+        view = camera_rect(camera_x, self.render_surface)
+        for prop in self.prop_index.query(view.left, view.right):
+            if isinstance(prop, Checkpoint):
+                color = (200, 200, 120) if self.respawn_point.x == prop.rect.x else (120, 140, 160)
+            else:
+                color = (80, 80, 120)
+            queue.add_rect("props", color, prop.rect)
+
+        # 스프라이트는 아틀라스 페이지에서 영역(area)만 잘라 그린다
+        atlas = self.assets["atlas"]
+        heart_image, heart_area = atlas.region("heart")
+        if self.heart_index is None or self.heart_index.size != len(self.world.hearts):
+            self.heart_index = IntervalIndex(self.world.hearts, margin=heart_area.width)
+        hearts = queue.layer("hearts")
+        for heart in self.heart_index.query(view.left, view.right):
+            x, y = heart.render_pos(alpha)
+            hearts.append((heart_image, (round(x), round(y)), heart_area))
+
+        sprites = self.assets["sprites"]
+        enemies = queue.layer("enemies")
+        # 적은 매 틱 움직이므로 인덱스 대신 rect로 바로 거른다 (보간 이동량 + 스프라이트 폭 여유)
+        cull_left = view.left - TILE_SIZE * 2
+        cull_right = view.right + TILE_SIZE
         for enemy in self.world.enemies:
+            if enemy.rect.right < cull_left or enemy.rect.left > cull_right:
+                continue
             if isinstance(enemy, Enemy1):
-                frames = self.assets["enemy1_frames"]
-                frame_index = int(enemy.anim_timer * 10) % len(frames)
-                facing = enemy.direction
+                image, area = sprites.region("enemy1", int(enemy.anim_timer * 10), enemy.direction)
             else:
-                frames = self.assets["enemy2_frames"]
-                frame_index = int(enemy.anim_timer * 8) % len(frames)
-                facing = enemy.direction
-            frame = frames[frame_index]
-            if facing < 0:
-                frame = pygame.transform.flip(frame, True, False)
-            self.render_surface.blit(frame, (enemy.rect.x - self.camera_x, enemy.rect.y))
+                image, area = sprites.region("enemy2", int(enemy.anim_timer * 8), enemy.direction)
+            x, y = enemy.render_pos(alpha)
+            enemies.append((image, (round(x), round(y)), area))
 
         if self.world.boss and self.world.boss.alive:
-            pygame.draw.rect(self.render_surface, self.world.boss.color, self.world.boss.rect.move(-self.camera_x, 0))
+            # 레벨 폭만큼 긴 빔도 화면 범위로 잘라 그린다
+            queue.add_rect("boss", self.world.boss.color, clip_to_view(self.world.boss.rect, view))
             for telegraph in self.world.boss.telegraphs:
-                pygame.draw.rect(self.render_surface, telegraph.color, telegraph.rect.move(-self.camera_x, 0), 1)
+                queue.add_rect("boss", telegraph.color, clip_to_view(telegraph.rect, view, outline=True), 1)
             for attack in self.world.boss.attacks:
-                pygame.draw.rect(self.render_surface, attack.color, attack.rect.move(-self.camera_x, 0))
+                queue.add_rect("boss", attack.color, clip_to_view(attack.rect, view))
 
-        goal = self.assets["goal"]
-        self.render_surface.blit(goal, (self.world.goal_rect.x - self.camera_x, self.world.goal_rect.y))
+        goal_image, goal_area = atlas.region("goal")
+        queue.add("goal", goal_image, self.world.goal_rect.topleft, goal_area)
 
         if not self.player.should_blink():
-            frame_index = 0
             if abs(self.player.vel.x) > 10 and self.player.on_ground:
-                run_frames = self.assets["player_run_frames"]
-                frame_index = int(self.player.anim_timer * 12) % len(run_frames)
-                frame = run_frames[frame_index]
+                image, area = sprites.region("player_run", int(self.player.anim_timer * 12), self.player.facing)
             else:
-                frame = self.assets["player_idle_frames"][0]
-            if self.player.facing < 0:
-                frame = pygame.transform.flip(frame, True, False)
-            self.render_surface.blit(frame, (self.player.rect.x - self.camera_x - 7, self.player.rect.y - 6))
+                image, area = sprites.region("player_idle", 0, self.player.facing)
+            x, y = self.player.render_pos(alpha)
+            queue.add("player", image, (round(x) - 7, round(y) - 6), area)
 
+        attack_image, attack_area = sprites.region("attack", 0, self.player.facing)
         for hitbox in self.attack_hitboxes:
-            attack_image = self.assets["attack"]
-            if self.player.facing < 0:
-                attack_image = pygame.transform.flip(attack_image, True, False)
-            self.render_surface.blit(attack_image, (hitbox.rect.x - self.camera_x, hitbox.rect.y))
+            queue.add("attacks", attack_image, hitbox.rect.topleft, attack_area)
 
-        for particle in self.particles:
-            self.render_surface.blit(self.assets["blood"], (particle.pos.x - self.camera_x, particle.pos.y))
+        queue.flush(self.render_surface, camera_x)
+        blood_image, blood_area = atlas.region("blood")
+        self.particles.draw(self.render_surface, blood_image, camera_x, blood_area)
 
     def draw(self):
         # UI/월드 렌더링 및 화면 스케일링
+        if self.state in STATIC_STATES and self.draw_static():
+            return
+        self.static_key = None
+        self.compose()
+        self.present()
+
+    def title_blink(self):
+        return (pygame.time.get_ticks() // 600) % 2 == 0
+
+    def draw_static(self):
+        # 타이틀/도움말/결과 화면은 바뀐 영역만 display.update로 갱신, 변화가 없으면 그리지 않는다
+        if self.profiler.enabled or self.presenter.scale is None or self.presenter.needs_layout(self.screen):
+            return False
+        key = (self.state, self.difficulty, self.message)
+        blink = self.title_blink()
+        if key != self.static_key:
+            self.compose()
+            self.presenter.invalidate()
+            self.presenter.present(self.screen, self.render_surface)
+            pygame.display.flip()
+            self.static_key = key
+            self.static_blink = blink
+        elif self.state == STATE_TITLE and blink != self.static_blink:
+            self.compose()
+            rects = self.presenter.present_rects(self.screen, self.render_surface, [self.title_renderer.hint_rect])
+            pygame.display.update(rects)
+            self.static_blink = blink
+        return True
+
+    def compose(self):
+        # 내부 해상도 render_surface에만 그린다 (화면 출력 없음)
         self.render_surface.fill((10, 10, 20))
         if self.state == STATE_TITLE:
-            blink = (pygame.time.get_ticks() // 600) % 2 == 0
+            blink = self.title_blink()
             self.title_renderer.draw(self.render_surface, self.big_font, self.font, blink, self.difficulty)
         elif self.state == STATE_HELP:
             draw_help(self.render_surface, self.font)
         else:
-            self.draw_world()
+            with self.profiler.section("draw_world"):
+                self.draw_world()
+            self.draw_overlay_text()
+
+    def draw_overlay_text(self):
+        with self.profiler.section("text"):
             if self.stage_timer > 0:
-                text = self.font.render(self.stage_text, True, (220, 200, 180))
+                text = render_text(self.font, self.stage_text, (220, 200, 180))
                 if self.stage_text == "임무는 끝나지 않았다.":
                     self.render_surface.blit(
                         text,
@@ -425,46 +692,104 @@ class Game:
                 else:
                     self.render_surface.blit(text, (8, 8))
             if self.notice_timer > 0:
-                note = self.font.render(self.notice, True, (220, 220, 200))
+                note = render_text(self.font, self.notice, (220, 220, 200))
                 self.render_surface.blit(note, (8, 26))
+        with self.profiler.section("hud"):
             self.hud.draw(self.render_surface, self.player, self.play_time)
+        with self.profiler.section("hint"):
             self.hint_box.draw(self.render_surface)
+        with self.profiler.section("text"):
             if self.state in (STATE_GAME_OVER, STATE_VICTORY):
-                end_text = self.big_font.render(self.message, True, (220, 140, 140))
+                end_text = render_text(self.big_font, self.message, (220, 140, 140))
                 self.render_surface.blit(
                     end_text,
                     (self.render_surface.get_width() // 2 - end_text.get_width() // 2, 80),
                 )
-                hint = self.font.render("R 재시작 / ESC 종료", True, (200, 200, 200))
+                hint = render_text(self.font, "R 재시작 / ESC 종료", (200, 200, 200))
                 self.render_surface.blit(
                     hint,
                     (self.render_surface.get_width() // 2 - hint.get_width() // 2, 110),
                 )
 
+    def present(self):
         shake_x = 0
         shake_y = 0
         if self.shake_timer > 0:
-            shake_x = random.randint(-self.shake_strength, self.shake_strength)
-            shake_y = random.randint(-self.shake_strength, self.shake_strength)
-        target_size = (
-            max(1, int(self.screen.get_width() * SCREEN_SCALE)),
-            max(1, int(self.screen.get_height() * SCREEN_SCALE)),
-        )
-        scaled = pygame.transform.scale(self.render_surface, target_size)
-        offset_x = (self.screen.get_width() - target_size[0]) // 2
-        offset_y = (self.screen.get_height() - target_size[1]) // 2
-        self.screen.blit(scaled, (offset_x + shake_x, offset_y + shake_y))
-        pygame.display.flip()
+            shake_x = self.fx_rng.randint(-self.shake_strength, self.shake_strength)
+            shake_y = self.fx_rng.randint(-self.shake_strength, self.shake_strength)
+        with self.profiler.section("scale"):
+            self.presenter.present(
+                self.screen,
+                self.render_surface,
+                shake=(shake_x, shake_y),
+                clear=self.profiler.enabled,
+            )
+        self.profiler.draw(self.screen, self.profiler_font)
+        with self.profiler.section("flip"):
+            pygame.display.flip()
+
+    def advance(self, frame_dt):
+        # 누적기 방식 고정 틱 갱신, 따라잡기 횟수를 제한해 히치 후 폭주를 막는다
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.fixed_dt and steps < MAX_CATCH_UP_STEPS:
+            self.update(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+        if steps == MAX_CATCH_UP_STEPS:
+            self.accumulator = min(self.accumulator, self.fixed_dt)
+        self.render_alpha = self.accumulator / self.fixed_dt
+        return steps
+
+    def simulate(self, ticks):
+        # 실시간과 무관하게 고정 틱을 연속 실행 (테스트/배치용)
+        for _ in range(ticks):
+            self.update(self.fixed_dt)
+        self.render_alpha = 1.0
+
+    def update_startup_trace(self, draw_start, frame_end):
+        # 첫 프레임(첫 flip 포함)과 게임플레이 준비가 모두 끝나면 시작 추적을 마감, 계속 실행하면 True
+        trace = self.trace
+        if trace.first_frame_ms is None:
+            trace.add("first_frame", draw_start, frame_end)
+            trace.mark_first_frame(frame_end)
+        if trace.ready_ms is None:
+            return True
+        trace.close()
+        print(trace.summary())
+        return not self.exit_after_startup
 
     def run(self):
         running = True
+        # 첫 프레임은 60fps 제한 대기 없이 바로 그린다
+        frame_limit = 0
         while running:
-            dt = self.clock.tick(60) / 1000.0
-            running = self.handle_events()
+            dt = self.clock.tick(frame_limit) / 1000.0
+            frame_limit = 60
+            frame_start = time.perf_counter()
+            with self.profiler.section("events"):
+                running = self.handle_events()
+            update_start = time.perf_counter()
             try:
-                self.update(dt)
+                if FIXED_TIMESTEP:
+                    self.advance(dt)
+                else:
+                    self.update(dt)
             except Exception as exc:
                 print(f"[오류] {exc}")
                 self.state = STATE_GAME_OVER
                 self.message = "장면이 깨졌다."
+            draw_start = time.perf_counter()
             self.draw()
+            frame_end = time.perf_counter()
+            # 첫 화면을 먼저 내보낸 뒤, 프레임 사이에서 도착한 게임플레이 에셋을 합친다
+            if self.asset_loader is not None:
+                self.poll_assets()
+            if not self.trace.closed:
+                running = self.update_startup_trace(draw_start, frame_end) and running
+            self.profiler.end_frame(frame_end - frame_start)
+            if self.telemetry:
+                self.telemetry.record_frame(self, dt, draw_start - update_start, frame_end - draw_start)
+        if self.asset_loader is not None:
+            # 로딩 도중 종료하면 pygame.quit 전에 로더 스레드를 정리
+            self.asset_loader.close()
@@ -0,0 +1,144 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from game import Game, STATE_PLAYING, STATE_TITLE
+from main import INTERNAL_WIDTH, INTERNAL_HEIGHT
+
+KEY_NAMES = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "a": pygame.K_a,
+    "d": pygame.K_d,
+    "shift": pygame.K_LSHIFT,
+    "space": pygame.K_SPACE,
+    "attack": pygame.K_r,
+    "read": pygame.K_e,
+    "enter": pygame.K_RETURN,
+    "easy": pygame.K_1,
+    "hard": pygame.K_2,
+    "escape": pygame.K_ESCAPE,
+}
+
+# (유지 시간(초), 누르고 있는 키, 첫 틱에 새로 누른 키), 틱 수는 시뮬레이션 주기에 맞춰 환산 (최소 1틱)
+STAGE_1_SCRIPT = [
+    (0.02, (), ("enter",)),
+    (0.67, ("right",), ()),
+    (0.33, ("right", "space"), ("space",)),
+    (1.0, ("right",), ("attack",)),
+    (0.42, ("right", "space"), ("space",)),
+    (0.17, ("right", "space"), ("space",)),
+    (1.33, ("right",), ("attack",)),
+    (0.5, ("right", "shift"), ()),
+    (0.42, ("right", "space"), ("space",)),
+    (0.17, ("right", "space"), ("space",)),
+    (2.0, ("right",), ("attack",)),
+    (10.0, ("right",), ("attack",)),
+]
+
+
+class KeyState:
+    # pygame.key.get_pressed() 결과처럼 인덱싱 가능한 키 상태
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    def __init__(self, segments, dt):
+        # dt: 시뮬레이션 틱 간격 (game.fixed_dt), 구간 시간을 틱 수로 바꿀 때 사용
+        self.segments = segments
+        self.dt = dt
+
+    def ticks(self):
+        # 틱마다 (키 상태, 이번 틱에 눌린 키 목록)을 순서대로 생성
+        for seconds, held, pressed in self.segments:
+            state = KeyState(KEY_NAMES[name] for name in held)
+            for index in range(max(1, round(seconds / self.dt))):
+                keys = tuple(KEY_NAMES[name] for name in pressed) if index == 0 else ()
+                yield state, keys
+
+
+def create_headless_game(hz=None, seed=None, stream_assets=False):
+    # 더미 비디오 드라이버로 1x1 디스플레이를 만들어 convert_alpha가 동작하게 한다
+    # stream_assets: main.py처럼 게임플레이 에셋을 백그라운드에서 읽는다
+    pygame.init()
+    screen = pygame.display.set_mode((1, 1))
+    render_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    game = Game(screen, render_surface, seed=seed, stream_assets=stream_assets)
+    if hz:
+        game.fixed_dt = 1.0 / hz
+    return game
+
+
+def play(game, inputs, render=False):
+    # 입력 스트림 한 번을 재생하고 실행한 틱 수를 반환
+    current = [KeyState()]
+    game.key_source = lambda: current[0]
+    started = False
+    ticks = 0
+    for keys, pressed in inputs:
+        current[0] = keys
+        for key in pressed:
+            game.handle_key_down(key)
+        game.update(game.fixed_dt)
+        if render:
+            game.compose()
+        ticks += 1
+        if game.state == STATE_PLAYING:
+            started = True
+        elif started:
+            break
+    return ticks
+
+
+def run_headless(segments=STAGE_1_SCRIPT, runs=1, render=False, hz=None, seed=0):
+    game = create_headless_game(hz, seed)
+    total_ticks = 0
+    results = []
+    start = time.perf_counter()
+    for index in range(runs):
+        # 실행마다 시드를 달리해 같은 입력으로 여러 전개를 확인
+        game.reseed(seed + index)
+        game.state = STATE_TITLE
+        game.reset_stage()
+        total_ticks += play(game, ScriptedInput(segments, game.fixed_dt).ticks(), render=render)
+        results.append((game.state, round(game.play_time, 2), game.player.hp))
+    elapsed = time.perf_counter() - start
+    return {
+        "runs": runs,
+        "ticks": total_ticks,
+        "seconds": elapsed,
+        "ticks_per_second": total_ticks / elapsed if elapsed > 0 else 0.0,
+        "simulated_seconds": total_ticks * game.fixed_dt,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 없이 stage_1 시뮬레이션 실행")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--render", action="store_true", help="render_surface에만 렌더링")
+    parser.add_argument("--hz", type=int, default=None, help="시뮬레이션 틱 주기 (60/120/240)")
+    parser.add_argument("--seed", type=int, default=0, help="첫 실행의 시드 (실행마다 1씩 증가)")
+    args = parser.parse_args()
+    stats = run_headless(runs=args.runs, render=args.render, hz=args.hz, seed=args.seed)
+    print(
+        f"[headless] {stats['runs']}회 {stats['ticks']}틱 "
+        f"{stats['seconds']:.2f}s -> {stats['ticks_per_second']:.0f} ticks/s "
+        f"(시뮬레이션 {stats['simulated_seconds']:.1f}s)"
+    )
+    for index, (state, play_time, hp) in enumerate(stats["results"][:10]):
+        print(f"  run {index}: {state} time={play_time} hp={hp}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
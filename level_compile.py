@@ -0,0 +1,93 @@
+import pygame
+
+from entities import Player
+from platformer_world import (
+    TILE_SIZE,
+    LEVEL_PIXEL_W,
+    LEVEL_PIXEL_H,
+    build_map,
+    build_solid_rects,
+    build_merged_solid_rects,
+)
+
+# 검증에 사용할 속도 조합 (픽셀/프레임, 타일 크기보다 작게 유지)
+PROBE_VELOCITIES = [
+    (0, 0),
+    (6, 0),
+    (-6, 0),
+    (0, 9),
+    (0, -9),
+    (5, 12),
+    (-5, 12),
+    (5, -12),
+    (-5, -12),
+    (15, 15),
+    (-15, -15),
+]
+
+
+class CompiledLevel:
+    def __init__(self, tiles, solids, tile_rect_count):
+        self.tiles = tiles
+        self.solids = solids
+        self.tile_rect_count = tile_rect_count
+
+    def report(self):
+        return f"[level] solids {self.tile_rect_count} -> {len(self.solids)}"
+
+
+def compile_level(tiles):
+    # 타일맵을 병합된 고체 직사각형 목록으로 컴파일
+    return CompiledLevel(tiles, build_merged_solid_rects(tiles), len(build_solid_rects(tiles)))
+
+
+def _resolve(rect, vel, solids):
+    # Player의 축 분리 충돌 해소를 그대로 재현
+    player = Player(rect.x, rect.y)
+    player.rect = rect.copy()
+    player.vel.update(vel)
+    player.rect.x += int(player.vel.x)
+    player._collide_axis(solids, axis="x")
+    player.rect.y += int(player.vel.y)
+    player.on_ground = False
+    player._collide_axis(solids, axis="y")
+    return player.rect.copy(), (player.vel.x, player.vel.y), player.on_ground
+
+
+def find_collision_mismatches(tiles, merged, step=4, size=(18, 24)):
+    # 타일 단위 solids와 병합 solids의 충돌 결과가 다른 위치를 모두 찾는다
+    tile_solids = build_solid_rects(tiles)
+    level_w = len(tiles[0]) * TILE_SIZE
+    level_h = len(tiles) * TILE_SIZE
+    mismatches = []
+    for y in range(-size[1], level_h, step):
+        for x in range(-size[0], level_w, step):
+            rect = pygame.Rect(x, y, size[0], size[1])
+            # 이미 지형에 박힌 시작 위치는 실제 게임에서 나오지 않으므로 제외
+            if rect.collidelist(tile_solids) != -1:
+                continue
+            for vel in PROBE_VELOCITIES:
+                expected = _resolve(rect, vel, tile_solids)
+                actual = _resolve(rect, vel, merged)
+                if expected != actual:
+                    mismatches.append((rect, vel, expected, actual))
+    return mismatches
+
+
+def main():
+    tiles = build_map()
+    level = compile_level(tiles)
+    print(level.report())
+    print(f"[level] stage_1 {LEVEL_PIXEL_W}x{LEVEL_PIXEL_H}px")
+    for size in ((18, 24), (14, 14)):
+        mismatches = find_collision_mismatches(tiles, level.solids, size=size)
+        print(f"[level] 충돌 비교 {size[0]}x{size[1]}: 불일치 {len(mismatches)}건")
+        for rect, vel, expected, actual in mismatches[:5]:
+            print(f"  {rect} vel={vel} tiles={expected} merged={actual}")
+        if mismatches:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
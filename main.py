@@ -1,6 +1,17 @@
+import time
+
+# 시작 추적 기준 시각 (아래 임포트 시간부터 잰다)
+STARTED_AT = time.perf_counter()
+
+import argparse
+
 import pygame
 
 from game import Game
+from setting import TELEMETRY_BUDGET_MS, TELEMETRY_HISTORY_FRAMES
+from startup_trace import StartupTrace
+
+IMPORTED_AT = time.perf_counter()
 
 
 INTERNAL_WIDTH = 400
@@ -8,20 +19,59 @@ INTERNAL_HEIGHT = 225
 SCALE = 4
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="거짓의 방")
+    parser.add_argument("--seed", type=int, default=None, help="게임플레이 난수 시드")
+    parser.add_argument("--record", default=None, help="틱 단위 입력을 기록할 파일 경로")
+    parser.add_argument("--telemetry", default=None, help="프레임 텔레메트리 파일 (.jsonl 또는 .csv)")
+    parser.add_argument("--startup-report", default=None, help="시작 구간별 시간 보고서(JSON) 저장 경로")
+    parser.add_argument("--exit-after-startup", action="store_true", help="첫 프레임과 스테이지 준비까지 잰 뒤 종료")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    trace = StartupTrace(STARTED_AT, report_path=args.startup_report)
+    trace.add("imports", STARTED_AT, IMPORTED_AT)
     # Pygame 초기화 및 창 설정
-    pygame.init()
-    pygame.display.set_caption("거짓의 방")
-    info = pygame.display.Info()
-    # 전체 화면 크기에 맞춰 표시 (프레임 없는 창)
-    screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
-    # 내부 렌더 해상도는 고정 크기로 유지
-    render_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
-    game = Game(screen, render_surface)
+    with trace.phase("pygame.init"):
+        pygame.init()
+    with trace.phase("display"):
+        pygame.display.set_caption("거짓의 방")
+        info = pygame.display.Info()
+        # 전체 화면 크기에 맞춰 표시 (프레임 없는 창)
+        screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
+        # 내부 렌더 해상도는 고정 크기로 유지
+        render_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    # 게임플레이 에셋은 타이틀 화면 뒤에서 읽는다
+    game = Game(screen, render_surface, seed=args.seed, stream_assets=True, trace=trace)
+    game.exit_after_startup = args.exit_after_startup
+    recorder = None
+    if args.record:
+        from replay import start_recording
+
+        recorder = start_recording(game)
+    if args.telemetry:
+        from telemetry import TelemetryRecorder
+
+        game.telemetry = TelemetryRecorder(
+            args.telemetry,
+            budget_ms=TELEMETRY_BUDGET_MS,
+            history=TELEMETRY_HISTORY_FRAMES,
+        )
     # 메인 루프 실행
     game.run()
+    if game.telemetry:
+        game.telemetry.close()
+    if recorder:
+        recorder.save(args.record)
+        print(f"[replay] 시드 {game.seed}, {recorder.ticks}틱 기록 -> {args.record}")
     pygame.quit()
+    # 시작 시간 측정 모드에서는 예산 초과를 종료 코드로 알린다
+    if args.exit_after_startup and not trace.within_budget():
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
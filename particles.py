@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+
+from setting import PARTICLE_CAPACITY
+
+PARTICLE_GRAVITY = 450
+
+
+def build_solid_grid(tiles):
+    # 파티클 충돌용 고체 타일 불리언 격자 [행, 열]
+    return np.array(tiles, dtype=np.int8) == 1
+
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        # 위치/속도/수명을 미리 할당한 배열에 담고, 살아 있는 입자는 항상 앞쪽 count개에 모아 둔다
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.timer = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, amount, rng=random):
+        # 난수는 입자마다 (vx, vy, 수명) 순서로 뽑는다 (상한에 걸려도 같은 개수를 소비해 재생 결과가 같게 유지)
+        for _ in range(amount):
+            vx = rng.uniform(-90, 90)
+            vy = rng.uniform(-160, -50)
+            timer = rng.uniform(0.4, 0.8)
+            if self.count >= self.capacity:
+                self.dropped += 1
+                continue
+            index = self.count
+            self.pos[index] = (x, y)
+            self.vel[index] = (vx, vy)
+            self.timer[index] = timer
+            self.count += 1
+
+    def update(self, dt):
+        count = self.count
+        if not count:
+            return
+        timer = self.timer[:count]
+        vel = self.vel[:count]
+        pos = self.pos[:count]
+        timer -= dt
+        vel[:, 1] += PARTICLE_GRAVITY * dt
+        pos += vel * dt
+        alive = timer > 0
+        if not alive.all():
+            self._compact(alive)
+
+    def collide(self, solid_grid, tile_size, size, dt):
+        # 파티클 아래쪽 중앙이 고체 타일에 들어간 것을 한 번에 찾아 제거하고, 내려앉은 위치 배열을 반환
+        count = self.count
+        if not count:
+            return None
+        width, height = size
+        pos = self.pos[:count]
+        cols = np.floor((pos[:, 0] + width / 2) / tile_size).astype(np.intp)
+        rows = np.floor((pos[:, 1] + height) / tile_size).astype(np.intp)
+        rows_n, cols_n = solid_grid.shape
+        inside = (cols >= 0) & (cols < cols_n) & (rows >= 0) & (rows < rows_n)
+        hit = np.zeros(count, dtype=bool)
+        hit[inside] = solid_grid[rows[inside], cols[inside]]
+        if not hit.any():
+            return None
+        landed = pos[hit].copy()
+        # 위에서 떨어진 경우 타일 윗면에 반쯤 걸치도록 맞춘다 (옆면에 부딪힌 것은 그 자리에 남김)
+        tile_top = rows[hit] * tile_size
+        previous_bottom = landed[:, 1] + height - self.vel[:count, 1][hit] * dt
+        from_above = previous_bottom <= tile_top
+        landed[from_above, 1] = tile_top[from_above] - height // 2
+        self._compact(~hit)
+        return landed
+
+    def _compact(self, alive):
+        # 죽은 입자를 빼고 순서를 유지한 채 앞으로 당긴다
+        keep = np.flatnonzero(alive)
+        kept = len(keep)
+        self.pos[:kept] = self.pos[keep]
+        self.vel[:kept] = self.vel[keep]
+        self.timer[:kept] = self.timer[keep]
+        self.count = kept
+
+    def draw(self, surface, image, camera_x, area=None):
+        # 한 번의 blits 호출로 일괄 렌더링 (blit의 실수 좌표처럼 0 쪽으로 버림)
+        # area: 아틀라스 페이지에서 그릴 영역 (없으면 image 전체)
+        count = self.count
+        if not count:
+            return
+        screen_pos = self.pos[:count] - (camera_x, 0)
+        np.trunc(screen_pos, out=screen_pos)
+        area = area or image.get_rect()
+        # 화면 밖 파티클은 배열 단계에서 걸러낸다
+        visible = (screen_pos[:, 0] > -area.width) & (screen_pos[:, 0] < surface.get_width())
+        if not visible.all():
+            screen_pos = screen_pos[visible]
+        surface.blits([(image, position, area) for position in screen_pos.tolist()], False)
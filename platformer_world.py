@@ -86,6 +86,81 @@ def build_solid_rects(tiles):
     return solids
 
 
+def build_merged_solid_rects(tiles):
+    # 인접한 고체 타일을 그리디 방식으로 최대 직사각형으로 합친다
+    height = len(tiles)
+    width = len(tiles[0]) if tiles else 0
+    used = [[False] * width for _ in range(height)]
+    solids = []
+    for y in range(height):
+        for x in range(width):
+            if tiles[y][x] != 1 or used[y][x]:
+                continue
+            run = 1
+            while x + run < width and tiles[y][x + run] == 1 and not used[y][x + run]:
+                run += 1
+            rows = 1
+            while y + rows < height and all(
+                tiles[y + rows][cx] == 1 and not used[y + rows][cx] for cx in range(x, x + run)
+            ):
+                rows += 1
+            for cy in range(y, y + rows):
+                for cx in range(x, x + run):
+                    used[cy][cx] = True
+            solids.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, run * TILE_SIZE, rows * TILE_SIZE))
+    return solids
+
+
+def solid_rects_in(tiles, rect):
+    # rect 아래에 있는 고체 타일만 build_solid_rects와 같은 순서(행 우선)로 반환
+    if not tiles:
+        return []
+    first_col = max(0, rect.left // TILE_SIZE)
+    last_col = min(len(tiles[0]) - 1, (rect.right - 1) // TILE_SIZE)
+    first_row = max(0, rect.top // TILE_SIZE)
+    last_row = min(len(tiles) - 1, (rect.bottom - 1) // TILE_SIZE)
+    solids = []
+    for y in range(first_row, last_row + 1):
+        row = tiles[y]
+        for x in range(first_col, last_col + 1):
+            if row[x] == 1:
+                solids.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+    return solids
+
+
+def find_patrol_bounds(tiles, rect):
+    # rect 높이에서 좌우로 가장 가까운 벽 위치와 발밑 바닥 행을 타일에서 한 번 계산 (순찰용)
+    # 반환: (왼쪽 벽 x, 오른쪽 벽 x, 바닥 행), 이미 벽과 겹쳐 있거나 맵 밖이면 None
+    if not tiles:
+        return None
+    rows = len(tiles)
+    cols = len(tiles[0])
+    first_col = rect.left // TILE_SIZE
+    last_col = (rect.right - 1) // TILE_SIZE
+    if first_col < 0 or last_col >= cols:
+        return None
+    body_rows = range(max(0, rect.top // TILE_SIZE), min(rows - 1, (rect.bottom - 1) // TILE_SIZE) + 1)
+
+    def blocked(col):
+        return any(tiles[row][col] == 1 for row in body_rows)
+
+    if any(blocked(col) for col in range(first_col, last_col + 1)):
+        return None
+    col = first_col - 1
+    while col >= 0 and not blocked(col):
+        col -= 1
+    wall_left = (col + 1) * TILE_SIZE if col >= 0 else float("-inf")
+    col = last_col + 1
+    while col < cols and not blocked(col):
+        col += 1
+    wall_right = col * TILE_SIZE if col < cols else float("inf")
+
+    # 발밑 앞쪽 판정에 쓸 바닥 행 (맵 위/아래로 벗어나면 None = 항상 고체)
+    floor_row = (rect.bottom + 1) // TILE_SIZE
+    floor = tiles[floor_row] if 0 <= floor_row < rows else None
+    return wall_left, wall_right, floor
+
+
 def build_signs():
     return [
         Sign(TILE_SIZE * 8, LEVEL_PIXEL_H - TILE_SIZE * 4, "대본은 거짓을 말하라 했다."),
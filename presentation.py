@@ -0,0 +1,65 @@
+import pygame
+
+from setting import PRESENTATION_MODE, SCREEN_SCALE
+
+
+class Presenter:
+    def __init__(self, source_size, mode=PRESENTATION_MODE):
+        # 내부 해상도 표면을 화면 크기에 맞춰 확대해 출력 (화면 크기가 바뀔 때만 재할당)
+        self.source_size = source_size
+        self.mode = mode
+        self.display_size = None
+        self.scale = 1
+        self.scaled = None
+        self.dest_rect = pygame.Rect(0, 0, 0, 0)
+        self.needs_clear = True
+        self.last_shake = (0, 0)
+
+    def _target_size(self, display_size):
+        source_w, source_h = self.source_size
+        display_w, display_h = display_size
+        if self.mode == "integer":
+            # 화면에 들어가는 가장 큰 정수 배율 (픽셀아트가 흐려지지 않음)
+            self.scale = max(1, min(display_w // source_w, display_h // source_h))
+            return source_w * self.scale, source_h * self.scale
+        self.scale = None
+        return max(1, int(display_w * SCREEN_SCALE)), max(1, int(display_h * SCREEN_SCALE))
+
+    def layout(self, screen):
+        self.display_size = screen.get_size()
+        size = self._target_size(self.display_size)
+        self.scaled = pygame.Surface(size, 0, screen)
+        self.dest_rect = self.scaled.get_rect(center=screen.get_rect().center)
+        self.needs_clear = True
+
+    def invalidate(self):
+        self.needs_clear = True
+
+    def needs_layout(self, screen):
+        return screen.get_size() != self.display_size
+
+    def present_rects(self, screen, source, rects):
+        # 정수 배율일 때 바뀐 영역만 확대해 화면에 옮기고, 갱신할 화면 영역 목록을 반환
+        scale = self.scale
+        updated = []
+        for rect in rects:
+            rect = rect.clip(source.get_rect())
+            if not rect.width or not rect.height:
+                continue
+            target = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+            pygame.transform.scale(source.subsurface(rect), target.size, self.scaled.subsurface(target))
+            screen_rect = target.move(self.dest_rect.topleft)
+            screen.blit(self.scaled, screen_rect, target)
+            updated.append(screen_rect)
+        return updated
+
+    def present(self, screen, source, shake=(0, 0), clear=False):
+        if screen.get_size() != self.display_size:
+            self.layout(screen)
+        pygame.transform.scale(source, self.scaled.get_size(), self.scaled)
+        # 흔들림으로 밀린 영역이나 레터박스에 잔상이 남지 않도록 필요할 때만 지운다
+        if clear or self.needs_clear or shake != (0, 0) or self.last_shake != (0, 0):
+            screen.fill((0, 0, 0))
+            self.needs_clear = False
+        self.last_shake = shake
+        screen.blit(self.scaled, self.dest_rect.move(shake))
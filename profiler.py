@@ -0,0 +1,120 @@
+import time
+from collections import deque
+
+import pygame
+
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class _NullSection:
+    # 비활성 상태에서 쓰는 공용 no-op 컨텍스트 (할당 없음)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, history=120):
+        self.enabled = False
+        self.history = history
+        self.order = []
+        self.samples = {}
+        self.current = {}
+        self._sections = {}
+        self.frame_times = deque(maxlen=history)
+        self.worst_frame = 0.0
+
+    def register(self, name):
+        # 측정 구간 등록 (오버레이에는 등록 순서대로 표시)
+        if name not in self._sections:
+            self.order.append(name)
+            self.samples[name] = deque(maxlen=self.history)
+            self._sections[name] = _Section(self, name)
+        return self._sections[name]
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        return self._sections.get(name) or self.register(name)
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self):
+        self.current = {}
+        self.frame_times.clear()
+        self.worst_frame = 0.0
+        for samples in self.samples.values():
+            samples.clear()
+
+    def end_frame(self, frame_seconds):
+        # 한 프레임의 구간 합계를 롤링 기록에 넣는다
+        if not self.enabled:
+            return
+        for name in self.order:
+            self.samples[name].append(self.current.get(name, 0.0))
+        self.current = {}
+        self.frame_times.append(frame_seconds)
+        self.worst_frame = max(self.worst_frame, frame_seconds)
+
+    def average_ms(self, name):
+        samples = self.samples.get(name)
+        if not samples:
+            return 0.0
+        return sum(samples) * 1000.0 / len(samples)
+
+    def draw(self, surface, font):
+        # 구간별 평균/최악 프레임/프레임 시간 그래프 오버레이
+        if not self.enabled:
+            return
+        line_h = font.get_linesize()
+        lines = []
+        if self.frame_times:
+            average = sum(self.frame_times) * 1000.0 / len(self.frame_times)
+            lines.append(f"frame {average:5.2f}ms  worst {self.worst_frame * 1000.0:5.2f}ms")
+        for name in self.order:
+            lines.append(f"{name:<12} {self.average_ms(name):5.2f}ms")
+        graph_w = self.history * 2
+        graph_h = 48
+        width = max([graph_w] + [font.size(line)[0] for line in lines]) + 8
+        height = len(lines) * line_h + graph_h + 12
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for idx, line in enumerate(lines):
+            panel.blit(font.render(line, True, (220, 220, 220)), (4, 4 + idx * line_h))
+        base_y = height - 4
+        scale = graph_h / (FRAME_BUDGET_MS * 2)
+        budget_y = base_y - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(panel, (200, 200, 80), (4, budget_y), (4 + graph_w, budget_y))
+        for idx, frame in enumerate(self.frame_times):
+            ms = frame * 1000.0
+            bar_h = min(graph_h, int(ms * scale))
+            color = (120, 200, 120) if ms <= FRAME_BUDGET_MS else (220, 80, 80)
+            pygame.draw.line(panel, color, (4 + idx * 2, base_y), (4 + idx * 2, base_y - bar_h))
+        surface.blit(panel, (8, 8))
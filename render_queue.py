@@ -0,0 +1,64 @@
+import pygame
+
+
+def _build_rect_surface(size, color, width):
+    # 단색(또는 테두리) 사각형을 blit 가능한 표면으로 만들어 둔다
+    if width:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), width)
+        return surface
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+class RenderQueue:
+    def __init__(self, layers, rect_cache_size=256):
+        # 레이어별로 (표면, 월드 좌표, 영역) 목록을 모았다가 flush에서 레이어 순서대로 한 번에 그린다
+        # 아틀라스 항목은 페이지 표면 + 영역, 단독 표면은 표면 전체 영역
+        self.order = list(layers)
+        self.layers = {name: [] for name in self.order}
+        self.rect_cache_size = rect_cache_size
+        self.rect_surfaces = {}
+
+    def layer(self, name):
+        # 많은 항목을 넣을 때는 목록을 직접 받아 (표면, 좌표, 영역)을 append
+        return self.layers[name]
+
+    def add(self, layer, surface, dest, area=None):
+        self.layers[layer].append((surface, dest, area or surface.get_rect()))
+
+    def add_rect(self, layer, color, rect, width=0):
+        # pygame.draw.rect 대신 같은 크기/색의 캐시된 표면을 큐에 넣는다
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        key = (rect.width, rect.height, tuple(color), width)
+        cached = self.rect_surfaces.get(key)
+        if cached is None:
+            if len(self.rect_surfaces) >= self.rect_cache_size:
+                self.rect_surfaces.clear()
+            surface = _build_rect_surface(rect.size, tuple(color)[:3], width)
+            cached = self.rect_surfaces[key] = (surface, surface.get_rect())
+        self.layers[layer].append((cached[0], rect.topleft, cached[1]))
+
+    def clear(self):
+        for entries in self.layers.values():
+            entries.clear()
+
+    def flush(self, surface, camera_x):
+        # 화면 밖 항목을 영역 폭 기준으로 걸러내고 카메라 좌표로 옮긴 뒤, 레이어 순서대로 이어 붙여 blits 한 번
+        left = camera_x
+        right = camera_x + surface.get_width()
+        batch = []
+        for name in self.order:
+            entries = self.layers[name]
+            if not entries:
+                continue
+            batch += [
+                (image, (x - camera_x, y), area)
+                for image, (x, y), area in entries
+                if x < right and x + area.width > left
+            ]
+            entries.clear()
+        if batch:
+            surface.blits(batch, False)
@@ -0,0 +1,192 @@
+import argparse
+import json
+import struct
+import time
+import zlib
+
+import pygame
+
+from headless import STAGE_1_SCRIPT, KeyState, ScriptedInput, create_headless_game, play
+
+MAGIC = b"LIES"
+VERSION = 1
+
+# Game.update가 매 틱 읽는 키 (비트마스크 순서)
+HELD_KEYS = (
+    pygame.K_a,
+    pygame.K_d,
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_LSHIFT,
+    pygame.K_RSHIFT,
+    pygame.K_SPACE,
+)
+
+# Game.handle_key_down이 반응하는 키 (이벤트 코드 순서)
+EVENT_KEYS = (
+    pygame.K_ESCAPE,
+    pygame.K_RETURN,
+    pygame.K_e,
+    pygame.K_1,
+    pygame.K_2,
+    pygame.K_UP,
+    pygame.K_SPACE,
+    pygame.K_r,
+)
+
+TICK_FORMAT = struct.Struct("<HB")
+
+
+class InputRecorder:
+    def __init__(self, game):
+        # 틱마다 눌린 키 비트마스크와 그 틱 이전에 들어온 키 이벤트를 기록
+        self.game = game
+        self.seed = game.seed
+        self.difficulty = game.difficulty
+        self.state = game.state
+        self.fixed_dt = game.fixed_dt
+        self.body = bytearray()
+        self.pending = []
+        self.ticks = 0
+
+    def key_down(self, key):
+        if key in EVENT_KEYS:
+            self.pending.append(EVENT_KEYS.index(key))
+
+    def tick(self, keys):
+        mask = 0
+        for bit, key in enumerate(HELD_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        self.body += TICK_FORMAT.pack(mask, len(self.pending))
+        self.body += bytes(self.pending)
+        self.pending = []
+        self.ticks += 1
+
+    def header(self):
+        return {
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "state": self.state,
+            "fixed_dt": self.fixed_dt,
+            "ticks": self.ticks,
+            "digest": self.game.state_digest(),
+        }
+
+    def recording(self):
+        # 파일을 거치지 않고 지금까지의 기록을 Recording으로 반환
+        return Recording(self.header(), bytes(self.body))
+
+    def save(self, path):
+        header = json.dumps(self.header()).encode("utf-8")
+        with open(path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(struct.pack("<BI", VERSION, len(header)))
+            handle.write(header)
+            handle.write(zlib.compress(bytes(self.body), 9))
+
+
+class Recording:
+    def __init__(self, header, body):
+        self.header = header
+        self.body = body
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as handle:
+            data = handle.read()
+        if data[:4] != MAGIC:
+            raise ValueError(f"기록 파일이 아닙니다: {path}")
+        version, header_len = struct.unpack_from("<BI", data, 4)
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 기록 버전: {version}")
+        offset = 4 + struct.calcsize("<BI")
+        header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+        body = zlib.decompress(data[offset + header_len:])
+        return cls(header, body)
+
+    def ticks(self):
+        # (키 상태, 이번 틱 전에 처리할 키 이벤트) 순서로 생성
+        offset = 0
+        while offset < len(self.body):
+            mask, count = TICK_FORMAT.unpack_from(self.body, offset)
+            offset += TICK_FORMAT.size
+            events = tuple(EVENT_KEYS[index] for index in self.body[offset:offset + count])
+            offset += count
+            held = (key for bit, key in enumerate(HELD_KEYS) if mask & (1 << bit))
+            yield KeyState(held), events
+
+
+def replay(game, recording, render=False, on_tick=None):
+    # 기록과 같은 시드/초기 상태에서 틱 단위로 입력을 다시 넣는다
+    header = recording.header
+    game.difficulty = header["difficulty"]
+    game.fixed_dt = header["fixed_dt"]
+    game.reseed(header["seed"])
+    game.reset_stage()
+    game.state = header["state"]
+    current = [KeyState()]
+    game.key_source = lambda: current[0]
+    ticks = 0
+    for keys, events in recording.ticks():
+        current[0] = keys
+        for key in events:
+            game.handle_key_down(key)
+        game.update(game.fixed_dt)
+        if render:
+            game.compose()
+        if on_tick:
+            on_tick(game, ticks)
+        ticks += 1
+    return ticks
+
+
+def start_recording(game):
+    # 현재 시드로 스테이지를 다시 시작하고 기록기를 연결
+    game.reseed(game.seed)
+    game.reset_stage()
+    game.recorder = InputRecorder(game)
+    return game.recorder
+
+
+def check_roundtrip(segments=STAGE_1_SCRIPT, seed=0):
+    # main.py --record처럼 에셋을 스트리밍하는 게임에서 기록하고, 새 헤드리스 게임에 재생해 상태를 비교
+    recorded = create_headless_game(seed=seed, stream_assets=True)
+    recorder = start_recording(recorded)
+    play(recorded, ScriptedInput(segments, recorded.fixed_dt).ticks())
+    recording = recorder.recording()
+    game = create_headless_game()
+    replay(game, recording)
+    return recording.header["digest"], game.state_digest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="입력 기록 재생 및 결과 검증")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--render", action="store_true", help="render_surface에도 렌더링")
+    parser.add_argument("--check", action="store_true", help="stage_1 스크립트를 기록 -> 재생해 결과 비교")
+    parser.add_argument("--seed", type=int, default=0, help="--check에서 기록할 시드")
+    args = parser.parse_args()
+    if args.check:
+        expected, digest = check_roundtrip(seed=args.seed)
+        status = "일치" if digest == expected else "불일치"
+        print(f"[replay] 기록 -> 재생 상태 {status} ({digest[:12]} / {expected[:12]})")
+        pygame.quit()
+        return 0 if digest == expected else 1
+    if not args.path:
+        parser.error("기록 파일 경로가 필요합니다 (또는 --check)")
+    recording = Recording.load(args.path)
+    game = create_headless_game()
+    start = time.perf_counter()
+    ticks = replay(game, recording, render=args.render)
+    elapsed = time.perf_counter() - start
+    digest = game.state_digest()
+    expected = recording.header["digest"]
+    status = "일치" if digest == expected else "불일치"
+    print(f"[replay] {ticks}틱 {elapsed:.2f}s 상태 {status} ({digest[:12]} / {expected[:12]})")
+    pygame.quit()
+    return 0 if digest == expected else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
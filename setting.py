@@ -21,3 +21,35 @@ SCREEN_SCALE = 0.9
 TITLE_BG_FILE = "title_bg.png"
 TITLE_TEXT_FILE = "title_text.png"
 HELP_BOX_ALPHA = 0
+
+# 고정 시간 간격 시뮬레이션 설정 (SIMULATION_HZ: 60 / 120 / 240)
+FIXED_TIMESTEP = True
+SIMULATION_HZ = 120
+MAX_CATCH_UP_STEPS = 5
+
+# 프레임 텔레메트리: 이 시간(ms)을 넘는 프레임이면 직전 기록을 덤프
+TELEMETRY_BUDGET_MS = 33.3
+TELEMETRY_HISTORY_FRAMES = 120
+
+# 화면 출력 방식: "integer" = 400x225의 최대 정수 배율 + 레터박스, "fit" = SCREEN_SCALE 비율
+PRESENTATION_MODE = "integer"
+
+# 동시에 살아 있을 수 있는 파티클 최대 개수 (넘치면 새 파티클을 버림)
+PARTICLE_CAPACITY = 4096
+
+# 충돌 판정 공간 해시의 셀 크기(px)
+SPATIAL_CELL_SIZE = 64
+
+# 적/하트 활성 구간: 화면 좌우로 이 거리(px) 밖이면 갱신을 멈춤 (None이면 항상 갱신)
+ACTIVATION_MARGIN = 160
+# 깨어날 때 잠든 동안의 타이머(애니메이션/떠다니기/돌진 대기)를 진행시킬지 여부
+SLEEP_FAST_FORWARD = True
+
+# 스프라이트 아틀라스 한 장의 크기(px), 다 들어가지 않으면 페이지를 추가
+ATLAS_PAGE_SIZE = 512
+
+# 시작 시 PNG 디코딩에 쓸 스레드 수 (게임플레이 에셋은 타이틀 화면 뒤에서 로드)
+ASSET_LOADER_WORKERS = 4
+
+# 시작 시간 예산(ms): 프로세스 임포트부터 첫 타이틀 프레임까지 (main.py --exit-after-startup이 초과 시 실패)
+STARTUP_BUDGET_MS = 400
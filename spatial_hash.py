@@ -0,0 +1,78 @@
+from setting import SPATIAL_CELL_SIZE
+
+# 항목이 이 개수 이하면 셀 조회보다 전체 순회가 빠르다
+LINEAR_SCAN_LIMIT = 8
+
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        # 균일 격자 셀 -> {항목 id: 항목}, 항목마다 (삽입 순번, 점유 셀 목록, 항목)을 기억
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = {}
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _keys(self, rect):
+        size = self.cell_size
+        first_x = rect.left // size
+        last_x = (rect.right - 1) // size
+        first_y = rect.top // size
+        last_y = (rect.bottom - 1) // size
+        return [(cx, cy) for cy in range(first_y, last_y + 1) for cx in range(first_x, last_x + 1)]
+
+    def insert(self, item, bounds=None):
+        # bounds: 항목이 움직일 수 있는 전체 범위 (없으면 현재 rect)
+        keys = self._keys(bounds or item.rect)
+        self.entries[id(item)] = (self.next_order, keys, item)
+        self.next_order += 1
+        for key in keys:
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = {}
+            cell[id(item)] = item
+
+    def remove(self, item):
+        entry = self.entries.pop(id(item), None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            cell = self.cells[key]
+            del cell[id(item)]
+            if not cell:
+                del self.cells[key]
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def query(self, rect):
+        # rect와 실제로 겹치는 항목을 삽입 순서대로 반환 (목록을 순회하던 기존 판정 순서 유지)
+        cells = self.cells
+        if not cells:
+            return []
+        if len(self.entries) <= LINEAR_SCAN_LIMIT:
+            return [entry[2] for entry in self.entries.values() if entry[2].rect.colliderect(rect)]
+        size = self.cell_size
+        first_x = rect.left // size
+        last_x = (rect.right - 1) // size
+        first_y = rect.top // size
+        last_y = (rect.bottom - 1) // size
+        if first_x == last_x and first_y == last_y:
+            found = cells.get((first_x, first_y))
+        else:
+            found = {}
+            for cy in range(first_y, last_y + 1):
+                for cx in range(first_x, last_x + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        found.update(cell)
+        if not found:
+            return []
+        hits = [item for item in found.values() if item.rect.colliderect(rect)]
+        if len(hits) > 1:
+            entries = self.entries
+            hits.sort(key=lambda item: entries[id(item)][0])
+        return hits
@@ -0,0 +1,93 @@
+import json
+import time
+from contextlib import contextmanager
+
+from setting import STARTUP_BUDGET_MS
+
+
+class StartupTrace:
+    def __init__(self, started_at=None, budget_ms=STARTUP_BUDGET_MS, report_path=None):
+        # 시작 구간(임포트, pygame.init, 창 생성, 에셋, 폰트, 월드, 첫 flip)별 시간 기록
+        # 구간 이름마다 첫 번째 기록만 남긴다 (스테이지 재시작 등은 시작 시간에 넣지 않음)
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.budget_ms = budget_ms
+        self.report_path = report_path
+        self.phases = []
+        self.first_frame_ms = None
+        self.ready_ms = None
+        self.closed = False
+
+    def elapsed_ms(self):
+        return round((time.perf_counter() - self.started_at) * 1000.0, 3)
+
+    def add(self, name, start, end, background=False):
+        # start/end는 perf_counter 값, background는 메인 스레드를 막지 않은 구간
+        if self.closed or any(phase["name"] == name for phase in self.phases):
+            return
+        self.phases.append(
+            {
+                "name": name,
+                "start_ms": round((start - self.started_at) * 1000.0, 3),
+                "ms": round((end - start) * 1000.0, 3),
+                "background": background,
+            }
+        )
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter())
+
+    def mark_first_frame(self, at=None):
+        # 예산은 첫 화면(타이틀)이 나가기까지의 시간에 건다 (at: 첫 flip이 끝난 perf_counter 값)
+        if self.first_frame_ms is None:
+            end = time.perf_counter() if at is None else at
+            self.first_frame_ms = round((end - self.started_at) * 1000.0, 3)
+
+    def mark_ready(self):
+        # 게임플레이 에셋과 첫 스테이지까지 준비된 시점
+        if self.ready_ms is None:
+            self.ready_ms = self.elapsed_ms()
+
+    def ordered_phases(self):
+        return sorted(self.phases, key=lambda phase: phase["start_ms"])
+
+    def within_budget(self):
+        return self.budget_ms is None or self.first_frame_ms is None or self.first_frame_ms <= self.budget_ms
+
+    def close(self):
+        # 기록을 마감하고 report_path가 있으면 보고서 저장, 예산을 넘었으면 False
+        if not self.closed:
+            self.closed = True
+            if self.report_path:
+                try:
+                    self.write(self.report_path)
+                except OSError as exc:
+                    print(f"[startup] 보고서 저장 실패: {exc}")
+        return self.within_budget()
+
+    def summary(self):
+        parts = [f"{phase['name']} {phase['ms']:.1f}" for phase in self.ordered_phases() if not phase["background"]]
+        line = f"[startup] 첫 프레임 {self.first_frame_ms:.1f}ms"
+        if self.ready_ms is not None:
+            line += f", 게임플레이 준비 {self.ready_ms:.1f}ms"
+        line += f" ({', '.join(parts)})"
+        if not self.within_budget():
+            line += f" -- 예산 {self.budget_ms:.0f}ms 초과"
+        return line
+
+    def to_dict(self):
+        return {
+            "first_frame_ms": self.first_frame_ms,
+            "ready_ms": self.ready_ms,
+            "budget_ms": self.budget_ms,
+            "within_budget": self.within_budget(),
+            "phases": self.ordered_phases(),
+        }
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=1)
@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import os
+import queue
+import threading
+from collections import deque
+
+import pygame
+
+FIELDS = (
+    "frame",
+    "dt_ms",
+    "update_ms",
+    "draw_ms",
+    "entities",
+    "particles",
+    "boss_attacks",
+    "state",
+)
+
+# 슬로 프레임 덤프에 함께 남길 입력 키
+TRACKED_KEYS = (
+    ("a", pygame.K_a),
+    ("d", pygame.K_d),
+    ("left", pygame.K_LEFT),
+    ("right", pygame.K_RIGHT),
+    ("lshift", pygame.K_LSHIFT),
+    ("rshift", pygame.K_RSHIFT),
+    ("space", pygame.K_SPACE),
+)
+
+
+class _Writer(threading.Thread):
+    def __init__(self, path, fmt, max_bytes, backups):
+        super().__init__(name="telemetry-writer", daemon=True)
+        self.path = path
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.jobs = queue.Queue(maxsize=64)
+        self.handle = None
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            kind, payload = job
+            try:
+                if kind == "records":
+                    self._write_records(payload)
+                else:
+                    path, data = payload
+                    with open(path, "w", encoding="utf-8") as handle:
+                        json.dump(data, handle, ensure_ascii=False, indent=1)
+            except OSError as exc:
+                print(f"[telemetry] 기록 실패: {exc}")
+        if self.handle:
+            self.handle.close()
+
+    def _open(self):
+        is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.handle = open(self.path, "a", encoding="utf-8", newline="")
+        if self.fmt == "csv" and is_new:
+            self.handle.write(",".join(FIELDS) + "\n")
+
+    def _rotate(self):
+        # 최대 크기를 넘으면 path.1, path.2 ... 로 밀어낸다
+        self.handle.close()
+        self.handle = None
+        for index in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _write_records(self, records):
+        if self.handle is None:
+            self._open()
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            for record in records:
+                writer.writerow([record[field] for field in FIELDS])
+            self.handle.write(buffer.getvalue())
+        else:
+            self.handle.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        self.handle.flush()
+        if self.max_bytes and self.handle.tell() >= self.max_bytes:
+            self._rotate()
+
+
+class TelemetryRecorder:
+    def __init__(self, path, budget_ms=33.3, history=120, flush_every=60, max_bytes=8 * 1024 * 1024, backups=3):
+        # 프레임 기록은 버퍼에 모았다가 백그라운드 스레드가 파일에 쓴다
+        fmt = "csv" if path.endswith(".csv") else "jsonl"
+        self.path = path
+        self.budget_ms = budget_ms
+        self.flush_every = flush_every
+        self.buffer = []
+        self.flight = deque(maxlen=history)
+        self.frame = 0
+        self.last_dump = -history
+        self.dropped = 0
+        self.writer = _Writer(path, fmt, max_bytes, backups)
+        self.writer.start()
+
+    def record_frame(self, game, dt, update_seconds, draw_seconds):
+        world = game.world
+        boss = world.boss
+        record = {
+            "frame": self.frame,
+            "dt_ms": round(dt * 1000.0, 3),
+            "update_ms": round(update_seconds * 1000.0, 3),
+            "draw_ms": round(draw_seconds * 1000.0, 3),
+            "entities": len(world.enemies) + len(world.hearts) + (1 if boss and boss.alive else 0),
+            "particles": len(game.particles),
+            "boss_attacks": len(boss.attacks) if boss else 0,
+            "state": game.state,
+        }
+        self.frame += 1
+        self.buffer.append(record)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+        # 플라이트 레코더: 최근 N프레임의 상태와 입력을 보관
+        keys = game.last_keys
+        player = game.player
+        self.flight.append(
+            dict(
+                record,
+                keys=[name for name, key in TRACKED_KEYS if keys is not None and keys[key]],
+                player=[player.rect.x, player.rect.y, round(player.vel.x, 2), round(player.vel.y, 2), player.hp],
+                camera_x=game.camera_x,
+            )
+        )
+        if record["dt_ms"] > self.budget_ms and self.frame - self.last_dump >= self.flight.maxlen:
+            self.dump_slow_frame(record)
+
+    def dump_slow_frame(self, record):
+        self.last_dump = self.frame
+        root, _ = os.path.splitext(self.path)
+        path = f"{root}_slow_{record['frame']}.json"
+        data = {"budget_ms": self.budget_ms, "slow_frame": record, "frames": list(self.flight)}
+        self._submit(("dump", (path, data)))
+
+    def flush(self):
+        if self.buffer:
+            self._submit(("records", self.buffer))
+            self.buffer = []
+
+    def _submit(self, job):
+        # 파일 쓰기가 밀려도 게임 루프는 막지 않는다 (큐가 차면 버림)
+        try:
+            self.writer.jobs.put_nowait(job)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        self.flush()
+        self.writer.jobs.put(None)
+        self.writer.join(timeout=2.0)
+        if self.dropped:
+            print(f"[telemetry] 큐 포화로 {self.dropped}건 버림")
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, capacity=256):
+        # (폰트, 문자열, 색, 안티앨리어싱) 키의 LRU 캐시
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, builder):
+        # 미리 합성해 둔 텍스트 블록 등 임의의 표면도 같은 LRU로 관리
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = builder()
+        self.entries[key] = surface
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return surface
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        return self.get_or_build(key, lambda: font.render(text, antialias, color))
+
+    def clear(self):
+        self.entries.clear()
+
+
+# ui.py와 game.py가 함께 쓰는 기본 캐시
+default_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    return default_cache.render(font, text, color, antialias)
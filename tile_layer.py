@@ -0,0 +1,56 @@
+import pygame
+
+from platformer_world import TILE_SIZE
+
+CHUNK_TILES = 16
+CHUNK_WIDTH = CHUNK_TILES * TILE_SIZE
+
+
+class TileLayer:
+    def __init__(self, tiles, floor, wall, background=None):
+        # 타일맵을 고정 폭 청크 표면으로 한 번만 구워 둔다
+        self.tiles = tiles
+        self.floor = floor
+        self.wall = wall
+        self.background = background
+        self.width = len(tiles[0]) * TILE_SIZE if tiles else 0
+        self.height = len(tiles) * TILE_SIZE
+        self.chunks = []
+        self.bake()
+
+    def bake(self):
+        # 레벨이 바뀌었을 때 다시 호출해 청크 전체를 새로 굽는다
+        self.chunks = []
+        for chunk_x in range(0, self.width, CHUNK_WIDTH):
+            chunk_w = min(CHUNK_WIDTH, self.width - chunk_x)
+            chunk = pygame.Surface((chunk_w, self.height)).convert()
+            chunk.fill((10, 10, 20))
+            if self.background:
+                for x in range(chunk_x - chunk_x % self.background.get_width(), chunk_x + chunk_w, self.background.get_width()):
+                    chunk.blit(self.background, (x - chunk_x, 0))
+            first_col = chunk_x // TILE_SIZE
+            last_col = (chunk_x + chunk_w) // TILE_SIZE
+            for y, row in enumerate(self.tiles):
+                for x in range(first_col, last_col):
+                    image = self.wall if row[x] == 1 else self.floor
+                    chunk.blit(image, (x * TILE_SIZE - chunk_x, y * TILE_SIZE))
+            self.chunks.append(chunk)
+
+    def stamp(self, image, positions):
+        # 바닥에 내려앉은 파티클을 데칼로 청크에 직접 찍는다 (이후 프레임 비용 없음)
+        image_w = image.get_width()
+        for x, y in positions:
+            x = int(x)
+            y = int(y)
+            first = max(0, x // CHUNK_WIDTH)
+            last = min(len(self.chunks) - 1, (x + image_w - 1) // CHUNK_WIDTH)
+            for index in range(first, last + 1):
+                self.chunks[index].blit(image, (x - index * CHUNK_WIDTH, y))
+
+    def draw(self, surface, camera_x):
+        # 카메라와 겹치는 청크(보통 1~3개)만 그린다
+        view_w = surface.get_width()
+        first = max(0, int(camera_x) // CHUNK_WIDTH)
+        last = min(len(self.chunks) - 1, int(camera_x + view_w) // CHUNK_WIDTH)
+        for index in range(first, last + 1):
+            surface.blit(self.chunks[index], (index * CHUNK_WIDTH - camera_x, 0))
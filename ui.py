@@ -2,24 +2,31 @@ import random
 import pygame
 
 from setting import HELP_BOX_ALPHA
+from text_cache import default_cache, render_text
 
 
 class TitleRenderer:
     def __init__(self, width, height, background=None, title_image=None):
         self.width = width
         self.height = height
-        self.background = pygame.Surface((width, height))
-        self._build_background()
-        self.background_image = background
-        self.title_image = title_image
+        # 배경/타이틀 이미지는 생성 시 한 번만 내부 해상도로 맞춰 둔다 (배경 이미지가 없을 때만 기본 패턴 생성)
+        if background:
+            self.background = pygame.transform.scale(background, (width, height))
+        else:
+            self.background = pygame.Surface((width, height))
+            self._build_background()
+        self.title = None
+        if title_image:
+            self.title = pygame.transform.scale(title_image, (width, title_image.get_height()))
+        self.hint_rect = None
 
     def _build_background(self):
-        # 기본 타이틀 배경 패턴 생성
+        # 기본 타이틀 배경 패턴 생성 (가로줄/세로 띠는 draw 대신 fill로 채움)
         for y in range(self.height):
             shade = 10 + int(40 * (y / self.height))
-            pygame.draw.line(self.background, (shade, shade, shade + 10), (0, y), (self.width, y))
+            self.background.fill((shade, shade, shade + 10), (0, y, self.width, 1))
         for x in range(0, self.width, 6):
-            pygame.draw.rect(self.background, (20, 10, 20), (x, 0, 3, self.height))
+            self.background.fill((20, 10, 20), (x, 0, 3, self.height))
         for _ in range(200):
             nx = random.randint(0, self.width - 1)
             ny = random.randint(0, self.height - 1)
@@ -27,26 +34,54 @@ class TitleRenderer:
 
     def draw(self, surface, title_font, font, blink, difficulty):
         # 타이틀 화면 렌더링 (이미지 우선, 없으면 기본 배경)
-        if self.background_image:
-            bg = pygame.transform.scale(self.background_image, (self.width, self.height))
-            surface.blit(bg, (0, 0))
-        else:
-            surface.blit(self.background, (0, 0))
-        hint_text = "ENTER 시작 / 1 EASY / 2 HARD / E 도움말 / ESC 종료"
-        hint = font.render(hint_text, True, (200, 200, 200)) if blink else None
+        surface.blit(self.background, (0, 0))
         mode_text = "현재 난이도: EASY" if difficulty == "easy" else "현재 난이도: HARD"
-        mode = font.render(mode_text, True, (220, 200, 200))
-        if self.title_image:
-            title = pygame.transform.scale(self.title_image, (self.width, self.title_image.get_height()))
-            surface.blit(title, (self.width // 2 - title.get_width() // 2, 40))
+        mode = render_text(font, mode_text, (220, 200, 200))
+        if self.title:
+            surface.blit(self.title, (self.width // 2 - self.title.get_width() // 2, 40))
         surface.blit(mode, (self.width // 2 - mode.get_width() // 2, 100))
-        if hint:
-            surface.blit(hint, (self.width // 2 - hint.get_width() // 2, 122))
+        hint_text = "ENTER 시작 / 1 EASY / 2 HARD / E 도움말 / ESC 종료"
+        hint = render_text(font, hint_text, (200, 200, 200))
+        # 깜빡임으로 바뀌는 영역 (부분 화면 갱신에 사용)
+        self.hint_rect = pygame.Rect(self.width // 2 - hint.get_width() // 2, 122, hint.get_width(), hint.get_height())
+        if blink:
+            surface.blit(hint, self.hint_rect)
 
 
 class HUD:
     def __init__(self, font):
         self.font = font
+        # 타이머는 숫자 글리프 스트립으로 바뀐 자리만 다시 그린다
+        color = (200, 200, 200)
+        self.label = font.render("TIME ", True, color)
+        self.glyphs = {char: font.render(char, True, color) for char in "0123456789."}
+        self.digit_w = max(self.glyphs[char].get_width() for char in "0123456789")
+        self.timer_surface = None
+        self.timer_layout = None
+        self.timer_text = ""
+
+    def _cell_width(self, char):
+        return self.glyphs["."].get_width() if char == "." else self.digit_w
+
+    def _update_timer(self, text):
+        layout = tuple(char == "." for char in text)
+        if layout != self.timer_layout:
+            width = self.label.get_width() + sum(self._cell_width(char) for char in text)
+            height = max(self.label.get_height(), self.font.get_height())
+            self.timer_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.timer_surface.blit(self.label, (0, 0))
+            self.timer_layout = layout
+            self.timer_text = " " * len(text)
+        x = self.label.get_width()
+        height = self.timer_surface.get_height()
+        for old, new in zip(self.timer_text, text):
+            cell_w = self._cell_width(new)
+            if old != new:
+                glyph = self.glyphs[new]
+                self.timer_surface.fill((0, 0, 0, 0), pygame.Rect(x, 0, cell_w, height))
+                self.timer_surface.blit(glyph, (x + (cell_w - glyph.get_width()) // 2, 0))
+            x += cell_w
+        self.timer_text = text
 
     def draw(self, surface, player, play_time):
         # HP 바와 플레이 타임 표시
@@ -55,8 +90,8 @@ class HUD:
             y = 6
             color = (200, 60, 80) if i < player.hp else (50, 50, 50)
             pygame.draw.rect(surface, color, pygame.Rect(x, y, 10, 8))
-        timer_text = self.font.render(f"TIME {play_time:05.2f}", True, (200, 200, 200))
-        surface.blit(timer_text, (surface.get_width() - timer_text.get_width() - 8, 6))
+        self._update_timer(f"{play_time:05.2f}")
+        surface.blit(self.timer_surface, (surface.get_width() - self.timer_surface.get_width() - 8, 6))
 
 
 class HintBox:
@@ -86,8 +121,10 @@ class HintBox:
 class HintBox:
     def __init__(self, font):
         self.font = font
+        self.panel = None
 
-    def draw(self, surface):
+    def _build_panel(self):
+        # 내용이 고정이므로 한 번만 합성해 둔다
         lines = [
             "R 공격",
             "SHIFT 달리기",
@@ -96,16 +133,24 @@ class HintBox:
         padding = 4
         width = max(self.font.size(line)[0] for line in lines) + padding * 2
         height = len(lines) * 14 + padding * 2
-        x = surface.get_width() - width - 8
-        y = surface.get_height() - height - 8
-        pygame.draw.rect(surface, (20, 20, 30), pygame.Rect(x, y, width, height))
+        panel = pygame.Surface((width, height))
+        panel.fill((20, 20, 30))
         for idx, line in enumerate(lines):
             text = self.font.render(line, True, (200, 200, 200))
-            surface.blit(text, (x + padding, y + padding + idx * 14))
+            panel.blit(text, (padding, padding + idx * 14))
+        return panel
 
+    def draw(self, surface):
+        if self.panel is None:
+            self.panel = self._build_panel()
+        x = surface.get_width() - self.panel.get_width() - 8
+        y = surface.get_height() - self.panel.get_height() - 8
+        surface.blit(self.panel, (x, y))
 
-def draw_help(surface, font):
-    surface.fill((12, 12, 20))
+
+def _build_help(size, font):
+    panel = pygame.Surface(size)
+    panel.fill((12, 12, 20))
     lines = [
         "도움말",
         "이동: A/D 또는 ←/→",
@@ -124,5 +169,13 @@ def draw_help(surface, font):
     for idx, line in enumerate(lines):
         color = (220, 220, 220) if idx == 0 else (180, 180, 180)
         text = font.render(line, True, color)
-        surface.blit(text, (20, y))
+        panel.blit(text, (20, y))
         y += 18
+    return panel
+
+
+def draw_help(surface, font):
+    # 도움말 화면 전체를 한 번 합성해 캐시에 두고 재사용
+    size = surface.get_size()
+    panel = default_cache.get_or_build(("help", font, size), lambda: _build_help(size, font))
+    surface.blit(panel, (0, 0))